@@ -1,4 +1,13 @@
-from typing import Any, Dict, Generic, Union, Optional, Callable
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Union,
+    Optional,
+    Callable,
+    Sequence,
+)
 from datetime import datetime, timezone
 import warnings
 
@@ -16,6 +25,7 @@ from sqlalchemy import (
     desc,
     or_,
     column,
+    Column,
 )
 from sqlalchemy.exc import ArgumentError, MultipleResultsFound, NoResultFound
 from sqlalchemy.sql import Join
@@ -40,6 +50,8 @@ from .helper import (
     _nest_join_data,
     _nest_multi_join_data,
     _handle_null_primary_key_multi_join,
+    _get_list_adapter,
+    _get_one_to_many_relationship,
     JoinConfig,
 )
 
@@ -627,6 +639,89 @@ class FastCRUD(
 
         return stmt
 
+    def _split_selectin_joins(
+        self,
+        joins_config: list[JoinConfig],
+        primary_select: list[Any],
+    ) -> tuple[list[JoinConfig], list[tuple[JoinConfig, str, Column]]]:
+        """
+        Separates the one-to-many joins that can be loaded with a follow-up `SELECT ... WHERE fk IN (...)` from those
+        that must be applied as SQL joins.
+
+        A join is loaded separately when it asks for `load_strategy="selectin"`, is a left join without alias or
+        `filters`, and `self.model` declares a matching one-to-many `relationship()` whose local column is part of
+        `primary_select`. Any other join falls back to the regular JOIN path, since inner joins and join filters also
+        decide which primary records are returned.
+
+        Args:
+            joins_config: Configurations for all joins.
+            primary_select: The columns selected from the primary model.
+
+        Returns:
+            The joins to apply to the statement, and the selectin joins with the parent column name and child column
+            used to match their rows.
+        """
+        selected_keys = {column.key for column in primary_select}
+        sql_joins: list[JoinConfig] = []
+        selectin_joins: list[tuple[JoinConfig, str, Column]] = []
+        for join in joins_config:
+            relationship = None
+            if (
+                join.load_strategy == "selectin"
+                and join.relationship_type == "one-to-many"
+                and join.join_type == "left"
+                and join.alias is None
+                and not join.filters
+            ):
+                relationship = _get_one_to_many_relationship(self.model, join.model)
+            if relationship is not None and relationship[0] in selected_keys:
+                selectin_joins.append((join, *relationship))
+            else:
+                sql_joins.append(join)
+
+        return sql_joins, selectin_joins
+
+    async def _load_selectin_joins(
+        self,
+        db: AsyncSession,
+        rows: list[dict],
+        selectin_joins: list[tuple[JoinConfig, str, Column]],
+    ) -> None:
+        """
+        Loads the rows of each selectin join with one query per join and nests them under their key in `rows`.
+
+        Args:
+            db: The SQLAlchemy async session.
+            rows: The primary model rows, updated in place.
+            selectin_joins: The joins returned by `_split_selectin_joins`.
+        """
+        for join, parent_key, child_column in selectin_joins:
+            nested_key = (
+                join.join_prefix.rstrip("_")
+                if join.join_prefix
+                else join.model.__tablename__
+            )
+            parent_values = {row[parent_key] for row in rows} - {None}
+            children: dict[Any, list[dict]] = {value: [] for value in parent_values}
+
+            if parent_values:
+                join_select = _extract_matching_columns_from_schema(
+                    join.model, join.schema_to_select
+                )
+                stmt = (
+                    select(*join_select, child_column.label("_fastcrud_parent_key"))
+                    .where(child_column.in_(parent_values))
+                    .order_by(*_get_primary_keys(join.model))
+                )
+
+                result = await db.execute(stmt)
+                for child in result.mappings():
+                    child_dict = dict(child)
+                    children[child_dict.pop("_fastcrud_parent_key")].append(child_dict)
+
+            for row in rows:
+                row[nested_key] = list(children.get(row[parent_key], []))
+
     async def create(
         self, db: AsyncSession, object: CreateSchemaType, commit: bool = True
     ) -> ModelType:
@@ -1272,7 +1367,7 @@ class FastCRUD(
                     "schema_to_select must be provided when return_as_model is True."
                 )
             try:
-                model_data = [schema_to_select(**row) for row in data]
+                model_data = _get_list_adapter(schema_to_select).validate_python(data)
                 response["data"] = model_data
             except ValidationError as e:
                 raise ValueError(
@@ -1561,8 +1656,13 @@ class FastCRUD(
                 )
             )
 
+        sql_joins, selectin_joins = (
+            self._split_selectin_joins(join_definitions, primary_select)
+            if nest_joins
+            else (join_definitions, [])
+        )
         stmt = self._prepare_and_apply_joins(
-            stmt=stmt, joins_config=join_definitions, use_temporary_prefix=nest_joins
+            stmt=stmt, joins_config=sql_joins, use_temporary_prefix=nest_joins
         )
         primary_filters = self._parse_filters(**kwargs)
         if primary_filters:
@@ -1574,6 +1674,7 @@ class FastCRUD(
                 raise ValueError(
                     "Cannot use one-to-many relationship with nest_joins=False"
                 )
+        if any(join.relationship_type == "one-to-many" for join in sql_joins):
             results = db_rows.fetchall()
             data_list = [dict(row._mapping) for row in results]
         else:
@@ -1589,14 +1690,112 @@ class FastCRUD(
                 for data in data_list:
                     nested_data = _nest_join_data(
                         data,
-                        join_definitions,
+                        sql_joins,
                         nested_data=nested_data,
                     )
+                if selectin_joins:
+                    await self._load_selectin_joins(db, [nested_data], selectin_joins)
                 return nested_data
             return data_list[0]
 
         return None
 
+    async def get_joined_many(
+        self,
+        db: AsyncSession,
+        ids: Sequence[Any],
+        schema_to_select: Optional[type[BaseModel]] = None,
+        joins_config: Optional[list[JoinConfig]] = None,
+        nest_joins: bool = False,
+        **kwargs: Any,
+    ) -> dict[Any, dict[str, Any]]:
+        """
+        Fetches several records by primary key, each with its joined data, in a single query.
+
+        This is the batched counterpart of calling `get_joined` once per id: a single `WHERE pk IN (...)` query is
+        issued and the returned rows are grouped by primary key. The model must have a single-column primary key,
+        and `schema_to_select`, if provided, must include it.
+
+        Args:
+            db: The SQLAlchemy async session.
+            ids: Primary key values of the records to fetch.
+            schema_to_select: Pydantic schema for selecting specific columns from the primary model.
+            joins_config: A list of `JoinConfig` instances describing the joins, as in `get_joined`.
+            nest_joins: If `True`, joined model data are nested under the `join_prefix` as in `get_joined`.
+            **kwargs: Additional filters to apply to the primary model query.
+
+        Returns:
+            A dictionary mapping each found primary key to its joined record. Ids with no matching record are omitted.
+
+        Raises:
+            ValueError: If `joins_config` is missing, the model has a composite primary key, or `schema_to_select` does not include the primary key.
+
+        Example:
+            ```python
+            tasks = await task_crud.get_joined_many(
+                db=session,
+                ids=[1, 3],
+                schema_to_select=ReadTaskSchema,
+                joins_config=[
+                    JoinConfig(
+                        model=Client,
+                        join_on=Task.client_id == Client.id,
+                        join_prefix="client_",
+                        schema_to_select=ReadClientSchema,
+                    ),
+                ],
+                nest_joins=True,
+            )
+            # tasks[1] and tasks[3] hold the same data get_joined(id=...) would return
+            ```
+        """
+        if not joins_config:
+            raise ValueError("joins_config is required for get_joined_many.")
+        if len(self._primary_keys) != 1:
+            raise ValueError("get_joined_many requires a single-column primary key.")
+
+        pk_name = self._primary_keys[0].name
+        primary_select = _extract_matching_columns_from_schema(
+            model=self.model,
+            schema=schema_to_select,
+        )
+        if pk_name not in {column.key for column in primary_select}:
+            raise ValueError(
+                f"schema_to_select must include the primary key '{pk_name}'."
+            )
+
+        if any(join.relationship_type == "one-to-many" for join in joins_config):
+            if nest_joins is False:
+                raise ValueError(
+                    "Cannot use one-to-many relationship with nest_joins=False"
+                )
+
+        stmt: Select = select(*primary_select).select_from(self.model)
+        stmt = self._prepare_and_apply_joins(
+            stmt=stmt, joins_config=joins_config, use_temporary_prefix=nest_joins
+        )
+        stmt = stmt.filter(getattr(self.model, pk_name).in_(ids))
+        primary_filters = self._parse_filters(**kwargs)
+        if primary_filters:
+            stmt = stmt.filter(*primary_filters)
+
+        db_rows = await db.execute(stmt)
+
+        results: dict[Any, dict[str, Any]] = {}
+        for row in db_rows.mappings():
+            data = dict(row)
+            key = data[pk_name]
+            if nest_joins:
+                results[key] = _nest_join_data(
+                    data,
+                    joins_config,
+                    nested_data=results.get(key, {}),
+                )
+            elif key not in results:
+                results[key] = data
+
+        return results
+
     async def get_multi_joined(
         self,
         db: AsyncSession,
@@ -1617,6 +1816,7 @@ class FastCRUD(
         joins_config: Optional[list[JoinConfig]] = None,
         return_total_count: bool = True,
         relationship_type: Optional[str] = None,
+        trust_db_types: bool = False,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """
@@ -1643,6 +1843,7 @@ class FastCRUD(
             joins_config: List of `JoinConfig` instances for specifying multiple joins. Each instance defines a model to join with, join condition, optional prefix for column names, schema for selecting specific columns, and join type.
             return_total_count: If `True`, also returns the total count of rows with the selected filters. Useful for pagination.
             relationship_type: Specifies the relationship type, such as `"one-to-one"` or `"one-to-many"`. Used to determine how to nest the joined data. If `None`, uses `"one-to-one"`.
+            trust_db_types: If `True` and `return_as_model` is set, builds models with `model_construct`, skipping validation of rows that come straight from the database. One-to-many nested rows are built with their join's `schema_to_select`; other nested join data is left as dictionaries. Defaults to `False`.
             **kwargs: Filters to apply to the primary query, including advanced comparison operators for refined searching.
 
         Returns:
@@ -1927,8 +2128,13 @@ class FastCRUD(
                 )
             )
 
+        sql_joins, selectin_joins = (
+            self._split_selectin_joins(join_definitions, primary_select)
+            if nest_joins
+            else (join_definitions, [])
+        )
         stmt = self._prepare_and_apply_joins(
-            stmt=stmt, joins_config=join_definitions, use_temporary_prefix=nest_joins
+            stmt=stmt, joins_config=sql_joins, use_temporary_prefix=nest_joins
         )
 
         primary_filters = self._parse_filters(**kwargs)
@@ -1944,35 +2150,48 @@ class FastCRUD(
             stmt = stmt.limit(limit)
 
         result = await db.execute(stmt)
-        data: list[Union[dict, BaseModel]] = []
-
+        rows: list[dict] = []
         for row in result.mappings().all():
             row_dict = dict(row)
 
             if nest_joins:
                 row_dict = _nest_join_data(
                     data=row_dict,
-                    join_definitions=join_definitions,
+                    join_definitions=sql_joins,
                 )
 
-            if return_as_model:
-                if schema_to_select is None:
-                    raise ValueError(
-                        "schema_to_select must be provided when return_as_model is True."
-                    )
+            rows.append(row_dict)
+
+        if selectin_joins and rows:
+            await self._load_selectin_joins(db, rows, selectin_joins)
+
+        nest_one_to_many = nest_joins and any(
+            join.relationship_type == "one-to-many" for join in join_definitions
+        )
+
+        data: list[Union[dict, BaseModel]]
+        if return_as_model and rows:
+            if schema_to_select is None:
+                raise ValueError(
+                    "schema_to_select must be provided when return_as_model is True."
+                )
+            if trust_db_types:
+                data = (
+                    list(rows)
+                    if nest_one_to_many
+                    else [schema_to_select.model_construct(**row) for row in rows]
+                )
+            else:
                 try:
-                    model_instance = schema_to_select(**row_dict)
-                    data.append(model_instance)
+                    data = _get_list_adapter(schema_to_select).validate_python(rows)
                 except ValidationError as e:
                     raise ValueError(
                         f"Data validation error for schema {schema_to_select.__name__}: {e}"
                     )
-            else:
-                data.append(row_dict)
+        else:
+            data = list(rows)
 
-        if nest_joins and any(
-            join.relationship_type == "one-to-many" for join in join_definitions
-        ):
+        if nest_one_to_many:
             nested_data = _nest_multi_join_data(
                 base_primary_key=self._primary_keys[0].name,
                 data=data,
@@ -1988,6 +2207,7 @@ class FastCRUD(
                     for join in join_definitions
                     if join.schema_to_select
                 },
+                trust_db_types=trust_db_types,
             )
         else:
             nested_data = _handle_null_primary_key_multi_join(data, join_definitions)
@@ -1995,13 +2215,98 @@ class FastCRUD(
         response: dict[str, Any] = {"data": nested_data}
 
         if return_total_count:
+            count_joins = joins_config
+            if joins_config and selectin_joins:
+                selectin_configs = [join for join, _, _ in selectin_joins]
+                count_joins = [
+                    join
+                    for join in joins_config
+                    if not any(join is selectin for selectin in selectin_configs)
+                ] or None
             total_count: int = await self.count(
-                db=db, joins_config=joins_config, **kwargs
+                db=db, joins_config=count_joins, **kwargs
             )
             response["total_count"] = total_count
 
         return response
 
+    async def iter_multi_joined(
+        self,
+        db: AsyncSession,
+        page_size: int = 100,
+        **kwargs: Any,
+    ) -> AsyncIterator[list[Union[dict, BaseModel]]]:
+        """
+        Iterates over all records matching the given criteria, one `get_multi_joined` page at a time.
+
+        Each page is fetched with `return_total_count=False`, so no `COUNT` query is issued, and iteration stops at the
+        first page shorter than `page_size`. Pass `sort_columns` to get a stable order across pages.
+
+        With `nest_joins=True`, one-to-many joins must be loaded with `load_strategy="selectin"`: the JOIN path pages
+        over joined rows, which would split a record's children across pages.
+
+        Args:
+            db: The SQLAlchemy async session.
+            page_size: Number of records fetched per page.
+            **kwargs: Any other `get_multi_joined` argument, such as join parameters, `sort_columns` or filters.
+
+        Yields:
+            The `"data"` list of each page.
+
+        Raises:
+            ValueError: If `page_size` is not positive, if `offset`, `limit` or `return_total_count` are passed, or if a
+                nested one-to-many join would be loaded through a SQL join.
+
+        Example:
+            ```python
+            async for page in user_crud.iter_multi_joined(
+                db=session,
+                page_size=500,
+                join_model=Tier,
+                join_prefix="tier_",
+                sort_columns="id",
+            ):
+                for user in page:
+                    ...
+            ```
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be a positive integer.")
+        if {"offset", "limit", "return_total_count"} & kwargs.keys():
+            raise ValueError(
+                "offset, limit and return_total_count are managed by iter_multi_joined."
+            )
+        if kwargs.get("nest_joins"):
+            primary_select = _extract_matching_columns_from_schema(
+                model=self.model,
+                schema=kwargs.get("schema_to_select"),
+            )
+            sql_joins, _ = self._split_selectin_joins(
+                kwargs.get("joins_config") or [], primary_select
+            )
+            if kwargs.get("relationship_type") == "one-to-many" or any(
+                join.relationship_type == "one-to-many" for join in sql_joins
+            ):
+                raise ValueError(
+                    "Nested one-to-many joins must use load_strategy='selectin' in iter_multi_joined."
+                )
+
+        offset = 0
+        while True:
+            page = await self.get_multi_joined(
+                db=db,
+                offset=offset,
+                limit=page_size,
+                return_total_count=False,
+                **kwargs,
+            )
+            data = page["data"]
+            if data:
+                yield data
+            if len(data) < page_size:
+                break
+            offset += page_size
+
     async def get_multi_by_cursor(
         self,
         db: AsyncSession,
@@ -2293,7 +2598,7 @@ class FastCRUD(
                     "schema_to_select must be provided when return_as_model is True."
                 )
             try:
-                model_data = [schema_to_select(**row) for row in data]
+                model_data = _get_list_adapter(schema_to_select).validate_python(data)
                 response["data"] = model_data
             except ValidationError as e:  # pragma: no cover
                 raise ValueError(
@@ -1,9 +1,12 @@
+from functools import lru_cache
+from sys import intern
 from typing import Any, Optional, Union, Sequence, cast
 
-from sqlalchemy import inspect
+from sqlalchemy import Column, inspect
+from sqlalchemy.orm import ONETOMANY, RelationshipProperty
 from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql import ColumnElement
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from pydantic.functional_validators import field_validator
 
 from fastcrud.types import ModelType
@@ -20,6 +23,7 @@ class JoinConfig(BaseModel):
     alias: Optional[AliasedClass] = None
     filters: Optional[dict] = None
     relationship_type: Optional[str] = "one-to-one"
+    load_strategy: str = "join"
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -30,6 +34,13 @@ class JoinConfig(BaseModel):
             raise ValueError(f"Invalid relationship type: {value}")  # pragma: no cover
         return value
 
+    @field_validator("load_strategy")
+    def check_valid_load_strategy(cls, value):
+        valid_load_strategies = {"join", "selectin"}
+        if value not in valid_load_strategies:
+            raise ValueError(f"Unsupported load strategy: {value}")
+        return value
+
     @field_validator("join_type")
     def check_valid_join_type(cls, value):
         valid_join_types = {"left", "inner"}
@@ -64,6 +75,23 @@ def _extract_matching_columns_from_schema(
         in the schema or all columns from the model if no schema is specified. These columns are correctly referenced
         through the provided alias if one is given.
     """
+    return list(
+        _get_matching_columns(
+            model, schema, prefix, alias, use_temporary_prefix, temp_prefix
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_matching_columns(
+    model: Any,
+    schema: Optional[type[BaseModel]],
+    prefix: Optional[str],
+    alias: Optional[AliasedClass],
+    use_temporary_prefix: Optional[bool],
+    temp_prefix: Optional[str],
+) -> tuple[Any, ...]:
+    """Memoized column lookup, so repeated queries build identical statements cheaply."""
     if not hasattr(model, "__table__"):  # pragma: no cover
         raise AttributeError(f"{model.__name__} does not have a '__table__' attribute.")
 
@@ -76,13 +104,15 @@ def _extract_matching_columns_from_schema(
         for field in schema.model_fields.keys():
             if hasattr(model_or_alias, field):
                 column = getattr(model_or_alias, field)
+                if isinstance(getattr(column, "property", None), RelationshipProperty):
+                    continue
                 if prefix is not None or use_temporary_prefix:
                     column_label = (
                         f"{temp_prefix}{prefix}{field}"
                         if prefix
                         else f"{temp_prefix}{field}"
                     )
-                    column = column.label(column_label)
+                    column = column.label(intern(column_label))
                 columns.append(column)
     else:
         for column in model.__table__.c:
@@ -93,10 +123,10 @@ def _extract_matching_columns_from_schema(
                     if prefix
                     else f"{temp_prefix}{column.key}"
                 )
-                column = column.label(column_label)
+                column = column.label(intern(column_label))
             columns.append(column)
 
-    return columns
+    return tuple(columns)
 
 
 def _auto_detect_join_condition(
@@ -117,6 +147,11 @@ def _auto_detect_join_condition(
         ValueError: If the join condition cannot be automatically determined.
         AttributeError: If either base_model or join_model does not have a `__table__` attribute.
     """
+    return _get_cached_join_condition(base_model, join_model)
+
+
+@lru_cache(maxsize=256)
+def _get_cached_join_condition(base_model: Any, join_model: Any) -> ColumnElement:
     if not hasattr(base_model, "__table__"):  # pragma: no cover
         raise AttributeError(
             f"{base_model.__name__} does not have a '__table__' attribute."
@@ -152,6 +187,44 @@ def _auto_detect_join_condition(
     return join_on
 
 
+def _get_one_to_many_relationship(
+    base_model: ModelType,
+    join_model: ModelType,
+) -> Optional[tuple[str, Column]]:
+    """
+    Finds the ORM `relationship()` declared on `base_model` that loads a list of `join_model` rows.
+
+    Args:
+        base_model: The SQLAlchemy model owning the relationship.
+        join_model: The SQLAlchemy model on the "many" side of the relationship.
+
+    Returns:
+        A tuple with the name of the `base_model` column referenced by the relationship and the `join_model` column
+        pointing back at it, or `None` if no single-column one-to-many relationship is declared.
+    """
+    return _get_cached_one_to_many_relationship(base_model, join_model)
+
+
+@lru_cache(maxsize=256)
+def _get_cached_one_to_many_relationship(
+    base_model: Any, join_model: Any
+) -> Optional[tuple[str, Column]]:
+    inspector = inspect(base_model, raiseerr=False)
+    if inspector is None:  # pragma: no cover
+        return None
+
+    for relationship in inspector.relationships:
+        if (
+            relationship.mapper.class_ is join_model
+            and relationship.direction is ONETOMANY
+            and len(relationship.local_remote_pairs) == 1
+        ):
+            local_column, remote_column = relationship.local_remote_pairs[0]
+            return local_column.name, remote_column
+
+    return None
+
+
 def _handle_one_to_one(nested_data, nested_key, nested_field, value):
     """
     Handles the nesting of one-to-one relationships in the data.
@@ -386,9 +459,11 @@ def _nest_join_data(
 
             if isinstance(key, str) and key.startswith(full_prefix):
                 nested_key = (
-                    join_prefix.rstrip("_") if join_prefix else join.model.__tablename__
+                    intern(join_prefix.rstrip("_"))
+                    if join_prefix
+                    else join.model.__tablename__
                 )
-                nested_field = key[len(full_prefix) :]
+                nested_field = intern(key[len(full_prefix) :])
 
                 if join.relationship_type == "one-to-many":
                     nested_data = _handle_one_to_many(
@@ -404,7 +479,7 @@ def _nest_join_data(
 
         if not nested:
             stripped_key = (
-                key[len(temp_prefix) :]
+                intern(key[len(temp_prefix) :])
                 if isinstance(key, str) and key.startswith(temp_prefix)
                 else key
             )
@@ -441,6 +516,12 @@ def _nest_join_data(
     return nested_data
 
 
+@lru_cache(maxsize=256)
+def _get_list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """Returns a cached `TypeAdapter` validating a list of `schema` in a single call."""
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
 def _nest_multi_join_data(
     base_primary_key: str,
     data: list[Union[dict, BaseModel]],
@@ -448,6 +529,7 @@ def _nest_multi_join_data(
     return_as_model: bool = False,
     schema_to_select: Optional[type[BaseModel]] = None,
     nested_schema_to_select: Optional[dict[str, type[BaseModel]]] = None,
+    trust_db_types: bool = False,
 ) -> Sequence[Union[dict, BaseModel]]:
     """
     Nests joined data based on join definitions provided for multiple records. This function processes the input list of
@@ -462,6 +544,7 @@ def _nest_multi_join_data(
                           dictionaries back to Pydantic models.
         return_as_model: If `True`, converts the fetched data to Pydantic models based on `schema_to_select`. Defaults to `False`.
         nested_schema_to_select: A dictionary mapping join prefixes to their corresponding Pydantic schemas.
+        trust_db_types: If `True`, builds the models with `model_construct` instead of validating the rows.
 
     Returns:
         Sequence[Union[dict, BaseModel]]: A list of dictionaries with nested structures for joined table data or Pydantic models.
@@ -523,21 +606,18 @@ def _nest_multi_join_data(
         ```
     """
     pre_nested_data = {}
+    row_dicts = [
+        row.model_dump() if isinstance(row, BaseModel) else row for row in data
+    ]
 
     for join_config in joins_config:
         join_primary_key = _get_primary_key(join_config.model)
 
-        for row in data:
-            if isinstance(row, BaseModel):
-                new_row = {
-                    key: (value[:] if isinstance(value, list) else value)
-                    for key, value in row.model_dump().items()
-                }
-            else:
-                new_row = {
-                    key: (value[:] if isinstance(value, list) else value)
-                    for key, value in row.items()
-                }
+        for row_dict in row_dicts:
+            new_row = {
+                key: (value[:] if isinstance(value, list) else value)
+                for key, value in row_dict.items()
+            }
 
             primary_key_value = new_row[base_primary_key]
 
@@ -567,18 +647,38 @@ def _nest_multi_join_data(
     nested_data: list = list(pre_nested_data.values())
 
     if return_as_model:
-        for i, item in enumerate(nested_data):
-            if nested_schema_to_select:
-                for prefix, schema in nested_schema_to_select.items():
-                    if prefix in item:
+        if nested_schema_to_select:
+            for prefix, schema in nested_schema_to_select.items():
+                items = [item for item in nested_data if prefix in item]
+                if trust_db_types:
+                    for item in items:
                         if isinstance(item[prefix], list):
                             item[prefix] = [
-                                schema(**nested_item) for nested_item in item[prefix]
+                                schema.model_construct(**nested_item)
+                                for nested_item in item[prefix]
                             ]
                         else:  # pragma: no cover
-                            item[prefix] = schema(**item[prefix])
-            if schema_to_select:
-                nested_data[i] = schema_to_select(**item)
+                            item[prefix] = schema.model_construct(**item[prefix])
+                    continue
+
+                list_items = [item for item in items if isinstance(item[prefix], list)]
+                validated = _get_list_adapter(schema).validate_python(
+                    [nested_item for item in list_items for nested_item in item[prefix]]
+                )
+                offset = 0
+                for item in list_items:
+                    size = len(item[prefix])
+                    item[prefix] = validated[offset : offset + size]
+                    offset += size
+                for item in items:
+                    if not isinstance(item[prefix], list):  # pragma: no cover
+                        item[prefix] = schema(**item[prefix])
+        if schema_to_select:
+            nested_data = (
+                [schema_to_select.model_construct(**item) for item in nested_data]
+                if trust_db_types
+                else _get_list_adapter(schema_to_select).validate_python(nested_data)
+            )
 
     return nested_data
 
@@ -24,12 +24,12 @@ def crud_router(
     path: str = "",
     tags: Optional[list[Union[str, Enum]]] = None,
     include_in_schema: bool = True,
-    create_deps: Sequence[Callable] = [],
-    read_deps: Sequence[Callable] = [],
-    read_multi_deps: Sequence[Callable] = [],
-    update_deps: Sequence[Callable] = [],
-    delete_deps: Sequence[Callable] = [],
-    db_delete_deps: Sequence[Callable] = [],
+    create_deps: Optional[Sequence[Callable]] = None,
+    read_deps: Optional[Sequence[Callable]] = None,
+    read_multi_deps: Optional[Sequence[Callable]] = None,
+    update_deps: Optional[Sequence[Callable]] = None,
+    delete_deps: Optional[Sequence[Callable]] = None,
+    db_delete_deps: Optional[Sequence[Callable]] = None,
     included_methods: Optional[list[str]] = None,
     deleted_methods: Optional[list[str]] = None,
     endpoint_creator: Optional[Type[EndpointCreator]] = None,
@@ -38,6 +38,7 @@ def crud_router(
     updated_at_column: str = "updated_at",
     endpoint_names: Optional[dict[str, str]] = None,
     filter_config: Optional[Union[FilterConfig, dict]] = None,
+    stream_threshold: Optional[int] = None,
 ) -> APIRouter:
     """
     Creates and configures a FastAPI router with CRUD endpoints for a given model.
@@ -47,7 +48,8 @@ def crud_router(
     as selective method inclusions or exclusions.
 
     Args:
-        session: The SQLAlchemy async session.
+        session: The SQLAlchemy async session dependency. It is resolved once per request and shared by the
+                 endpoint, so it should yield a session backed by a pooled engine rather than a single shared connection.
         model: The SQLAlchemy model.
         create_schema: Pydantic schema for creating an item.
         update_schema: Pydantic schema for updating an item.
@@ -72,6 +74,10 @@ def crud_router(
                         (`"create"`, `"read"`, `"update"`, `"delete"`, `"db_delete"`, `"read_multi"`), and
                         values are the custom names to use. Unspecified operations will use default names.
         filter_config: Optional `FilterConfig` instance or dictionary to configure filters for the `read_multi` endpoint.
+        stream_threshold: Optional `limit` above which unpaginated `read_multi` responses are streamed row by row
+                          instead of being built in memory. Rows are read through a dedicated session on the same
+                          engine, so the `session` dependency may be closed before the response is sent.
+                          Defaults to `None` (never stream).
 
     Returns:
         Configured `APIRouter` instance with the CRUD endpoints.
@@ -541,6 +547,7 @@ def crud_router(
         updated_at_column=updated_at_column,
         endpoint_names=endpoint_names,
         filter_config=filter_config,
+        stream_threshold=stream_threshold,
     )
 
     endpoint_creator_instance.add_routes_to_router(
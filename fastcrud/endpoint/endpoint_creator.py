@@ -1,8 +1,12 @@
+import json
 from typing import Type, Optional, Callable, Sequence, Union
 from enum import Enum
 
 from fastapi import Depends, Body, Query, APIRouter
 from pydantic import ValidationError
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastcrud.crud.fast_crud import FastCRUD
@@ -22,6 +26,8 @@ from ..paginated.response import paginated_response
 from .helper import (
     CRUDMethods,
     FilterConfig,
+    _DEFAULT_CRUD_METHODS,
+    _VALID_CRUD_METHODS,
     _extract_unique_columns,
     _get_primary_keys,
     _get_python_type,
@@ -42,7 +48,8 @@ class EndpointCreator:
     The method assumes `id` is the primary key for path parameters.
 
     Attributes:
-        session: The SQLAlchemy async session.
+        session: The SQLAlchemy async session dependency. It is resolved once per request and shared by the
+                 endpoint, so it should yield a session backed by a pooled engine rather than a single shared connection.
         model: The SQLAlchemy model.
         create_schema: Pydantic schema for creating an item.
         update_schema: Pydantic schema for updating an item.
@@ -58,6 +65,10 @@ class EndpointCreator:
                         (`"create"`, `"read"`, `"update"`, `"delete"`, `"db_delete"`, `"read_multi"`), and
                         values are the custom names to use. Unspecified operations will use default names.
         filter_config: Optional `FilterConfig` instance or dictionary to configure filters for the `read_multi` endpoint.
+        stream_threshold: Optional `limit` above which unpaginated `read_multi` responses are streamed row by row
+                          instead of being built in memory. Rows are read through a dedicated session on the same
+                          engine, so the `session` dependency may be closed before the response is sent.
+                          Defaults to `None` (never stream).
 
     Raises:
         ValueError: If both `included_methods` and `deleted_methods` are provided.
@@ -235,6 +246,18 @@ class EndpointCreator:
         ```
     """
 
+    _DEFAULT_INCLUDED_METHODS = _DEFAULT_CRUD_METHODS
+
+    # (operation, endpoint factory, HTTP method, attribute that must be set)
+    _ROUTE_SPECS: tuple[tuple[str, str, str, Optional[str]], ...] = (
+        ("create", "_create_item", "POST", None),
+        ("read", "_read_item", "GET", None),
+        ("read_multi", "_read_items", "GET", None),
+        ("update", "_update_item", "PATCH", None),
+        ("delete", "_delete_item", "DELETE", None),
+        ("db_delete", "_db_delete", "DELETE", "delete_schema"),
+    )
+
     def __init__(
         self,
         session: Callable,
@@ -251,13 +274,18 @@ class EndpointCreator:
         updated_at_column: str = "updated_at",
         endpoint_names: Optional[dict[str, str]] = None,
         filter_config: Optional[Union[FilterConfig, dict]] = None,
+        stream_threshold: Optional[int] = None,
     ) -> None:
         self._primary_keys = _get_primary_keys(model)
         self._primary_keys_types = {
             pk.name: _get_python_type(pk) for pk in self._primary_keys
         }
-        self.primary_key_names = [pk.name for pk in self._primary_keys]
+        self.primary_key_names = list(self._primary_keys_types)
+        self._pk_path = "/".join(f"{{{n}}}" for n in self.primary_key_names)
+        self._pk_suffix = f"/{self._pk_path}"
+        self._model_name = model.__name__
         self.session = session
+        self._session_dep = Depends(self.session, use_cache=True)
         self.crud = crud or FastCRUD(
             model=model,
             is_deleted_column=is_deleted_column,
@@ -284,12 +312,18 @@ class EndpointCreator:
             "read_multi": "",
         }
         self.endpoint_names = {**self.default_endpoint_names, **(endpoint_names or {})}
+        self._resolved_names = {
+            operation: self.endpoint_names.get(operation, default_name)
+            for operation, default_name in self.default_endpoint_names.items()
+        }
         if filter_config:
             if isinstance(filter_config, dict):
                 filter_config = FilterConfig(**filter_config)
             self._validate_filter_config(filter_config)
         self.filter_config = filter_config
+        self.stream_threshold = stream_threshold
         self.column_types = _get_column_types(model)
+        self._endpoint_cache: dict[str, Callable] = {}
 
     def _validate_filter_config(self, filter_config: FilterConfig) -> None:
         model_columns = self.crud.model_col_names
@@ -301,22 +335,32 @@ class EndpointCreator:
 
     def _create_item(self):
         """Creates an endpoint for creating items in the database."""
+        unique_columns = _extract_unique_columns(self.model)
+        unique_col_names = tuple(column.name for column in unique_columns)
+        unique_col_set = set(unique_col_names)
 
         async def endpoint(
-            db: AsyncSession = Depends(self.session),
+            db: AsyncSession = self._session_dep,
             item: self.create_schema = Body(...),  # type: ignore
         ):
-            unique_columns = _extract_unique_columns(self.model)
-
-            for column in unique_columns:
-                col_name = column.name
-                if hasattr(item, col_name):
-                    value = getattr(item, col_name)
-                    exists = await self.crud.exists(db, **{col_name: value})
-                    if exists:  # pragma: no cover
-                        raise DuplicateValueException(
-                            f"Value {value} is already registered"
-                        )
+            if unique_col_names:
+                data = item.model_dump(include=unique_col_set)
+                provided = [
+                    (column, data[col_name])
+                    for column, col_name in zip(unique_columns, unique_col_names)
+                    if col_name in data
+                ]
+
+                if provided:
+                    stmt = select(
+                        *(exists().where(column == value) for column, value in provided)
+                    )
+                    taken = (await db.execute(stmt)).one()
+                    for (_, value), is_taken in zip(provided, taken):
+                        if is_taken:
+                            raise DuplicateValueException(
+                                f"Value {value} is already registered"
+                            )
 
             return await self.crud.create(db, item)
 
@@ -326,7 +370,7 @@ class EndpointCreator:
         """Creates an endpoint for reading a single item from the database."""
 
         @_apply_model_pk(**self._primary_keys_types)
-        async def endpoint(db: AsyncSession = Depends(self.session), **pkeys):
+        async def endpoint(db: AsyncSession = self._session_dep, **pkeys):
             item = await self.crud.get(db, **pkeys)
             if not item:  # pragma: no cover
                 raise NotFoundException(detail="Item not found")
@@ -339,7 +383,7 @@ class EndpointCreator:
         dynamic_filters = _create_dynamic_filters(self.filter_config, self.column_types)
 
         async def endpoint(
-            db: AsyncSession = Depends(self.session),
+            db: AsyncSession = self._session_dep,
             offset: Optional[int] = Query(
                 None, description="Offset for unpaginated queries"
             ),
@@ -380,6 +424,14 @@ class EndpointCreator:
                 offset = 0
                 limit = 100
 
+            if self.stream_threshold is not None and limit > self.stream_threshold:  # type: ignore
+                return await self._stream_items(
+                    db,
+                    offset=offset,  # type: ignore
+                    limit=limit,  # type: ignore
+                    filters=filters,
+                )
+
             crud_data = await self.crud.get_multi(
                 db,
                 offset=offset, # type: ignore
@@ -390,13 +442,49 @@ class EndpointCreator:
 
         return endpoint
 
+    async def _stream_items(
+        self, db: AsyncSession, offset: int, limit: int, filters: dict
+    ) -> Union[StreamingResponse, dict]:
+        """
+        Streams a `read_multi` page as JSON without materializing every row first.
+
+        The body is sent after the endpoint returns, when the `session` dependency may already be torn down, so the
+        count and the rows are both read through a dedicated session bound to the same engine or connection, and the
+        request session never checks out a connection. Sessions without a single bind fall back to a regular,
+        buffered response.
+        """
+        if limit < 0 or offset < 0:
+            raise ValueError("Limit and offset must be non-negative.")
+
+        bind = db.bind
+        if bind is None:
+            return await self.crud.get_multi(db, offset=offset, limit=limit, **filters)
+
+        stmt = await self.crud.select(**filters)
+        if offset:
+            stmt = stmt.offset(offset)
+        stmt = stmt.limit(limit)
+
+        async def body():
+            async with AsyncSession(bind) as stream_db:
+                total_count = await self.crud.count(stream_db, **filters)
+                result = await stream_db.stream(stmt)
+                yield b'{"data":['
+                separator = b""
+                async for row in result.mappings():
+                    yield separator + json.dumps(jsonable_encoder(dict(row))).encode()
+                    separator = b","
+                yield f'],"total_count":{total_count}}}'.encode()
+
+        return StreamingResponse(body(), media_type="application/json")
+
     def _update_item(self):
         """Creates an endpoint for updating an existing item in the database."""
 
         @_apply_model_pk(**self._primary_keys_types)
         async def endpoint(
             item: self.update_schema = Body(...),  # type: ignore
-            db: AsyncSession = Depends(self.session),
+            db: AsyncSession = self._session_dep,
             **pkeys,
         ):
             return await self.crud.update(db, item, **pkeys)
@@ -407,7 +495,7 @@ class EndpointCreator:
         """Creates an endpoint for deleting an item from the database."""
 
         @_apply_model_pk(**self._primary_keys_types)
-        async def endpoint(db: AsyncSession = Depends(self.session), **pkeys):
+        async def endpoint(db: AsyncSession = self._session_dep, **pkeys):
             await self.crud.delete(db, **pkeys)
             return {"message": "Item deleted successfully"}  # pragma: no cover
 
@@ -423,7 +511,7 @@ class EndpointCreator:
         """
 
         @_apply_model_pk(**self._primary_keys_types)
-        async def endpoint(db: AsyncSession = Depends(self.session), **pkeys):
+        async def endpoint(db: AsyncSession = self._session_dep, **pkeys):
             await self.crud.db_delete(db, **pkeys)
             return {
                 "message": "Item permanently deleted from the database"
@@ -431,28 +519,26 @@ class EndpointCreator:
 
         return endpoint
 
+    def _get_endpoint_name(self, operation: str) -> str:
+        return self._resolved_names.get(operation, operation)
+
     def _get_endpoint_path(self, operation: str):
-        endpoint_name = self.endpoint_names.get(
-            operation, self.default_endpoint_names.get(operation, operation)
-        )
+        endpoint_name = self._get_endpoint_name(operation)
         path = f"{self.path}/{endpoint_name}" if endpoint_name else self.path
 
         if operation in {"read", "update", "delete", "db_delete"}:
-            _primary_keys_path_suffix = "/".join(
-                f"{{{n}}}" for n in self.primary_key_names
-            )
-            path = f"{path}/{_primary_keys_path_suffix}"
+            return path + self._pk_suffix
 
         return path
 
     def add_routes_to_router(
         self,
-        create_deps: Sequence[Callable] = [],
-        read_deps: Sequence[Callable] = [],
-        read_multi_deps: Sequence[Callable] = [],
-        update_deps: Sequence[Callable] = [],
-        delete_deps: Sequence[Callable] = [],
-        db_delete_deps: Sequence[Callable] = [],
+        create_deps: Optional[Sequence[Callable]] = None,
+        read_deps: Optional[Sequence[Callable]] = None,
+        read_multi_deps: Optional[Sequence[Callable]] = None,
+        update_deps: Optional[Sequence[Callable]] = None,
+        delete_deps: Optional[Sequence[Callable]] = None,
+        db_delete_deps: Optional[Sequence[Callable]] = None,
         included_methods: Optional[Sequence[str]] = None,
         deleted_methods: Optional[Sequence[str]] = None,
     ):
@@ -519,105 +605,67 @@ class EndpointCreator:
             )
 
         if included_methods is None:
-            included_methods = [
-                "create",
-                "read",
-                "read_multi",
-                "update",
-                "delete",
-                "db_delete",
-            ]
+            included_methods = self._DEFAULT_INCLUDED_METHODS
         else:
-            try:
-                included_methods = CRUDMethods(
-                    valid_methods=included_methods
-                ).valid_methods
-            except ValidationError as e:
-                raise ValueError(f"Invalid CRUD methods in included_methods: {e}")
+            if not _VALID_CRUD_METHODS.issuperset(included_methods):
+                try:
+                    CRUDMethods(valid_methods=included_methods)
+                except ValidationError as e:
+                    raise ValueError(f"Invalid CRUD methods in included_methods: {e}")
 
         if deleted_methods is None:
             deleted_methods = []
         else:
-            try:
-                deleted_methods = CRUDMethods(
-                    valid_methods=deleted_methods
-                ).valid_methods
-            except ValidationError as e:
-                raise ValueError(f"Invalid CRUD methods in deleted_methods: {e}")
+            if not _VALID_CRUD_METHODS.issuperset(deleted_methods):
+                try:
+                    CRUDMethods(valid_methods=deleted_methods)
+                except ValidationError as e:
+                    raise ValueError(f"Invalid CRUD methods in deleted_methods: {e}")
+
+        included = frozenset(included_methods)
+        deleted = frozenset(deleted_methods)
 
         delete_description = "Delete a"
         if self.delete_schema:
             delete_description = "Soft delete a"
 
-        if ("create" in included_methods) and ("create" not in deleted_methods):
-            self.router.add_api_route(
-                self._get_endpoint_path(operation="create"),
-                self._create_item(),
-                methods=["POST"],
-                include_in_schema=self.include_in_schema,
-                tags=self.tags,
-                dependencies=_inject_dependencies(create_deps),
-                description=f"Create a new {self.model.__name__} row in the database.",
-            )
-
-        if ("read" in included_methods) and ("read" not in deleted_methods):
-            self.router.add_api_route(
-                self._get_endpoint_path(operation="read"),
-                self._read_item(),
-                methods=["GET"],
-                include_in_schema=self.include_in_schema,
-                tags=self.tags,
-                dependencies=_inject_dependencies(read_deps),
-                description=f"Read a single {self.model.__name__} row from the database by its primary keys: {self.primary_key_names}.",
-            )
-
-        if ("read_multi" in included_methods) and ("read_multi" not in deleted_methods):
-            self.router.add_api_route(
-                self._get_endpoint_path(operation="read_multi"),
-                self._read_items(),
-                methods=["GET"],
-                include_in_schema=self.include_in_schema,
-                tags=self.tags,
-                dependencies=_inject_dependencies(read_multi_deps),
-                description=f"Read multiple {self.model.__name__} rows from the database with a limit and an offset.",
-            )
+        descriptions = {
+            "create": f"Create a new {self._model_name} row in the database.",
+            "read": f"Read a single {self._model_name} row from the database by its primary keys: {self.primary_key_names}.",
+            "read_multi": f"Read multiple {self._model_name} rows from the database with a limit and an offset.",
+            "update": f"Update an existing {self._model_name} row in the database by its primary keys: {self.primary_key_names}.",
+            "delete": f"{delete_description} {self._model_name} row from the database by its primary keys: {self.primary_key_names}.",
+            "db_delete": f"Permanently delete a {self._model_name} row from the database by its primary keys: {self.primary_key_names}.",
+        }
+        deps_by_operation = {
+            "create": create_deps or (),
+            "read": read_deps or (),
+            "read_multi": read_multi_deps or (),
+            "update": update_deps or (),
+            "delete": delete_deps or (),
+            "db_delete": db_delete_deps or (),
+        }
 
-        if ("update" in included_methods) and ("update" not in deleted_methods):
-            self.router.add_api_route(
-                self._get_endpoint_path(operation="update"),
-                self._update_item(),
-                methods=["PATCH"],
-                include_in_schema=self.include_in_schema,
-                tags=self.tags,
-                dependencies=_inject_dependencies(update_deps),
-                description=f"Update an existing {self.model.__name__} row in the database by its primary keys: {self.primary_key_names}.",
-            )
+        for operation, factory_name, http_method, gate in self._ROUTE_SPECS:
+            if (operation not in included) or (operation in deleted):
+                continue
+            if gate is not None and not getattr(self, gate):
+                continue
 
-        if ("delete" in included_methods) and ("delete" not in deleted_methods):
-            path = self._get_endpoint_path(operation="delete")
-            self.router.add_api_route(
-                path,
-                self._delete_item(),
-                methods=["DELETE"],
-                include_in_schema=self.include_in_schema,
-                tags=self.tags,
-                dependencies=_inject_dependencies(delete_deps),
-                description=f"{delete_description} {self.model.__name__} row from the database by its primary keys: {self.primary_key_names}.",
-            )
+            endpoint = self._endpoint_cache.get(operation)
+            if endpoint is None:
+                endpoint = self._endpoint_cache[operation] = getattr(
+                    self, factory_name
+                )()
 
-        if (
-            ("db_delete" in included_methods)
-            and ("db_delete" not in deleted_methods)
-            and self.delete_schema
-        ):
             self.router.add_api_route(
-                self._get_endpoint_path(operation="db_delete"),
-                self._db_delete(),
-                methods=["DELETE"],
+                self._get_endpoint_path(operation=operation),
+                endpoint,
+                methods=[http_method],
                 include_in_schema=self.include_in_schema,
                 tags=self.tags,
-                dependencies=_inject_dependencies(db_delete_deps),
-                description=f"Permanently delete a {self.model.__name__} row from the database by its primary keys: {self.primary_key_names}.",
+                dependencies=_inject_dependencies(deps_by_operation[operation]),
+                description=descriptions[operation],
             )
 
     def add_custom_route(
@@ -1,7 +1,9 @@
 import inspect
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, Union, Annotated, Sequence, Callable, TypeVar, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from pydantic.functional_validators import field_validator
 from fastapi import Depends, Query, params
 
@@ -12,38 +14,39 @@ from fastcrud.types import ModelType
 
 F = TypeVar("F", bound=Callable[..., Any])
 
-
-class CRUDMethods(BaseModel):
-    valid_methods: Annotated[
-        Sequence[str],
-        Field(
-            default=[
-                "create",
-                "read",
-                "read_multi",
-                "update",
-                "delete",
-                "db_delete",
-            ]
-        ),
-    ]
-
-    @field_validator("valid_methods")
-    def check_valid_method(cls, values: Sequence[str]) -> Sequence[str]:
-        valid_methods = {
-            "create",
-            "read",
-            "read_multi",
-            "update",
-            "delete",
-            "db_delete",
-        }
-
-        for v in values:
-            if v not in valid_methods:
-                raise ValueError(f"Invalid CRUD method: {v}")
-
-        return values
+_DEFAULT_CRUD_METHODS = (
+    "create",
+    "read",
+    "read_multi",
+    "update",
+    "delete",
+    "db_delete",
+)
+_VALID_CRUD_METHODS = frozenset(_DEFAULT_CRUD_METHODS)
+
+
+@dataclass(frozen=True)
+class CRUDMethods:
+    valid_methods: Sequence[str] = field(
+        default_factory=lambda: list(_DEFAULT_CRUD_METHODS)
+    )
+
+    def __post_init__(self) -> None:
+        invalid = next(
+            (v for v in self.valid_methods if v not in _VALID_CRUD_METHODS), None
+        )
+        if invalid is not None:
+            raise ValidationError.from_exception_data(
+                self.__class__.__name__,
+                [
+                    {
+                        "type": "value_error",
+                        "loc": ("valid_methods",),
+                        "input": self.valid_methods,
+                        "ctx": {"error": ValueError(f"Invalid CRUD method: {invalid}")},
+                    }
+                ],
+            )
 
 
 class FilterConfig(BaseModel):
@@ -77,12 +80,17 @@ def _get_primary_key(
 
 def _get_primary_keys(
     model: ModelType,
-) -> Sequence[Column]:
+) -> tuple[Column, ...]:
     """Get the primary key of a SQLAlchemy model."""
+    return _get_cached_primary_keys(model)
+
+
+@lru_cache(maxsize=256)
+def _get_cached_primary_keys(model: Any) -> tuple[Column, ...]:
     inspector_result = sa_inspect(model)
     if inspector_result is None:  # pragma: no cover
         raise ValueError("Model inspection failed, resulting in None.")
-    primary_key_columns: Sequence[Column] = inspector_result.mapper.primary_key
+    primary_key_columns: tuple[Column, ...] = tuple(inspector_result.mapper.primary_key)
 
     return primary_key_columns
 
@@ -114,13 +122,16 @@ def _get_column_types(
     return column_types
 
 
+@lru_cache(maxsize=None)
 def _extract_unique_columns(
     model: ModelType,
-) -> Sequence[KeyedColumnElement]:
+) -> tuple[KeyedColumnElement, ...]:
     """Extracts columns from a SQLAlchemy model that are marked as unique."""
     if not hasattr(model, "__table__"):  # pragma: no cover
         raise AttributeError(f"{model.__name__} does not have a '__table__' attribute.")
-    unique_columns = [column for column in model.__table__.columns if column.unique]
+    unique_columns = tuple(
+        column for column in model.__table__.columns if column.unique
+    )
     return unique_columns
 
 
@@ -145,6 +156,9 @@ def _apply_model_pk(**pkeys: dict[str, type]):
     This decorator injects positional arguments into a fastCRUD endpoint.
     It dynamically changes the endpoint signature and allows to use
     multiple primary keys without defining them explicitly.
+
+    The signature is rewritten once, when the endpoint is built. FastAPI reads it
+    a single time at route registration, so requests carry no extra overhead.
     """
 
     def wrapper(endpoint):
@@ -12,6 +12,7 @@ from sqlalchemy import (
     ForeignKey,
     Boolean,
     DateTime,
+    insert,
     make_url,
 )
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
@@ -295,7 +296,7 @@ def is_docker_running() -> bool:  # pragma: no cover
 
 @asynccontextmanager
 async def _async_session(url: str) -> AsyncGenerator[AsyncSession]:
-    async_engine = create_async_engine(url, echo=True, future=True)
+    async_engine = create_async_engine(url, echo=False, future=True)
 
     session = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -305,8 +306,11 @@ async def _async_session(url: str) -> AsyncGenerator[AsyncSession]:
 
         yield s
 
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    # An in-memory SQLite database disappears with its connection, so only
+    # server-backed databases need their tables dropped.
+    if async_engine.url.database not in (None, "", ":memory:"):
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
 
     await async_engine.dispose()
 
@@ -396,6 +400,43 @@ def test_data_booking() -> list[dict]:
     ]
 
 
+async def bulk_seed(session: AsyncSession, mapping: dict) -> None:
+    """Insert each model's rows with one executemany and commit once."""
+    for model, rows in mapping.items():
+        await session.execute(insert(model), rows)
+    await session.commit()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def seeded_session(
+    async_session: AsyncSession, test_data: list[dict], test_data_tier: list[dict]
+) -> AsyncSession:
+    """Session with the tier and test rows already committed."""
+    await bulk_seed(async_session, {TierModel: test_data_tier, ModelTest: test_data})
+    return async_session
+
+
+@pytest_asyncio.fixture(scope="function")
+async def seeded_booking_session(
+    async_session: AsyncSession,
+    test_data: list[dict],
+    test_data_tier: list[dict],
+    test_data_category: list[dict],
+    test_data_booking: list[dict],
+) -> AsyncSession:
+    """Session with the tier, category, test and booking rows already committed."""
+    await bulk_seed(
+        async_session,
+        {
+            TierModel: test_data_tier,
+            CategoryModel: test_data_category,
+            ModelTest: test_data,
+            BookingModel: test_data_booking,
+        },
+    )
+    return async_session
+
+
 @pytest.fixture
 def test_model():
     return ModelTest
@@ -1,8 +1,9 @@
 import pytest
-from sqlalchemy import and_
 from fastcrud import FastCRUD, JoinConfig, aliased
 from ...sqlalchemy.conftest import (
+    bulk_seed,
     ModelTest,
+    MultiPkModel,
     TierModel,
     CreateSchemaTest,
     TierSchemaTest,
@@ -23,129 +24,81 @@ from ...sqlalchemy.conftest import (
     TaskRead,
 )
 
+_CRUD_MODELTEST = FastCRUD(ModelTest)
+_CRUD_BOOKING = FastCRUD(BookingModel)
+_CRUD_CARD = FastCRUD(Card)
+_CRUD_TASK = FastCRUD(Task)
 
-@pytest.mark.asyncio
-async def test_get_joined_basic(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_joined(
-        db=async_session,
-        join_model=TierModel,
-        join_prefix="tier_",
-        schema_to_select=CreateSchemaTest,
-        join_schema_to_select=TierSchemaTest,
-    )
-
-    assert result is not None
-    assert "name" in result
-    assert "tier_name" in result
-
-
-@pytest.mark.asyncio
-async def test_get_joined_custom_condition(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    user_data_with_condition = [item for item in test_data if item["name"] == "Alice"]
-    for user_item in user_data_with_condition:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_joined(
-        db=async_session,
-        join_model=TierModel,
-        join_on=and_(ModelTest.tier_id == TierModel.id),
+_TIER_JOINS = [
+    JoinConfig(
+        model=TierModel,
+        join_on=ModelTest.tier_id == TierModel.id,
         join_prefix="tier_",
-        schema_to_select=CreateSchemaTest,
-        join_schema_to_select=TierSchemaTest,
-        name="Alice",
+        schema_to_select=TierSchemaTest,
     )
-
-    assert result is not None
-    assert result["name"] == "Alice"
-    assert "tier_name" in result
+]
 
 
 @pytest.mark.asyncio
-async def test_get_joined_with_prefix(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_joined(
-        db=async_session,
+@pytest.mark.parametrize(
+    "kwargs, present, absent, nested",
+    [
+        pytest.param(
+            {"join_prefix": "tier_"}, {"name", "tier_name"}, set(), None, id="prefix"
+        ),
+        pytest.param({"join_type": "left"}, {"name"}, set(), None, id="left_join"),
+        pytest.param({"join_type": "inner"}, {"name"}, set(), None, id="inner_join"),
+        pytest.param({"name": "Alice"}, {"name"}, set(), None, id="filters"),
+        pytest.param(
+            {"join_prefix": "tier_", "nest_joins": True},
+            {"name", "tier"},
+            {"tier_name"},
+            "tier",
+            id="nest_joins",
+        ),
+        pytest.param(
+            {"nest_joins": True},
+            {"name", TierModel.__tablename__},
+            set(),
+            TierModel.__tablename__,
+            id="nested_no_prefix",
+        ),
+        pytest.param(
+            {}, {"name", "tier_id"}, {"tier_name"}, None, id="no_prefix_no_nesting"
+        ),
+    ],
+)
+async def test_get_joined_variants(seeded_session, kwargs, present, absent, nested):
+    result = await _CRUD_MODELTEST.get_joined(
+        db=seeded_session,
         join_model=TierModel,
-        join_prefix="tier_",
         schema_to_select=CreateSchemaTest,
         join_schema_to_select=TierSchemaTest,
+        **kwargs,
     )
 
-    assert result is not None
-    assert "name" in result
-    assert "tier_name" in result
+    assert result is not None, "Expected a joined result."
+    assert present <= result.keys(), f"Missing keys: {present - result.keys()}"
+    assert not absent & result.keys(), f"Unexpected keys: {absent & result.keys()}"
+    if nested is not None:
+        assert "name" in result[nested], f"Expected 'name' inside nested '{nested}'."
+    if "name" in kwargs:
+        assert result["name"] == kwargs["name"]
 
 
 @pytest.mark.asyncio
-async def test_get_joined_different_join_types(
-    async_session, test_data, test_data_tier
-):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    result_left = await crud.get_joined(
-        db=async_session,
-        join_model=TierModel,
-        join_type="left",
-        schema_to_select=CreateSchemaTest,
-        join_schema_to_select=TierSchemaTest,
-    )
-
-    result_inner = await crud.get_joined(
-        db=async_session,
-        join_model=TierModel,
-        join_type="inner",
-        schema_to_select=CreateSchemaTest,
-        join_schema_to_select=TierSchemaTest,
+async def test_get_joined_custom_condition(async_session, test_data, test_data_tier):
+    user_data_with_condition = [item for item in test_data if item["name"] == "Alice"]
+    await bulk_seed(
+        async_session,
+        {TierModel: test_data_tier, ModelTest: user_data_with_condition},
     )
 
-    assert result_left is not None
-    assert result_inner is not None
-
-
-@pytest.mark.asyncio
-async def test_get_joined_with_filters(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_joined(
+    result = await _CRUD_MODELTEST.get_joined(
         db=async_session,
         join_model=TierModel,
+        join_on=ModelTest.tier_id == TierModel.id,
+        join_prefix="tier_",
         schema_to_select=CreateSchemaTest,
         join_schema_to_select=TierSchemaTest,
         name="Alice",
@@ -153,15 +106,14 @@ async def test_get_joined_with_filters(async_session, test_data, test_data_tier)
 
     assert result is not None
     assert result["name"] == "Alice"
+    assert "tier_name" in result
 
 
 @pytest.mark.asyncio
 async def test_update_multiple_records_allow_multiple(
     async_session, test_model, test_data
 ):
-    for item in test_data:
-        async_session.add(test_model(**item))
-    await async_session.commit()
+    await bulk_seed(async_session, {test_model: test_data})
 
     crud = FastCRUD(test_model)
     await crud.update(
@@ -179,9 +131,7 @@ async def test_update_multiple_records_allow_multiple(
 
 @pytest.mark.asyncio
 async def test_count_with_advanced_filters(async_session, test_model, test_data):
-    for item in test_data:
-        async_session.add(test_model(**item))
-    await async_session.commit()
+    await bulk_seed(async_session, {test_model: test_data})
 
     crud = FastCRUD(test_model)
     count_gt = await crud.count(async_session, id__gt=1)
@@ -195,22 +145,16 @@ async def test_count_with_advanced_filters(async_session, test_model, test_data)
 async def test_get_joined_multiple_models(
     async_session, test_data, test_data_tier, test_data_category
 ):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for category_item in test_data_category:
-        async_session.add(CategoryModel(**category_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        user_item_modified = user_item.copy()
-        user_item_modified["category_id"] = 1
-        async_session.add(ModelTest(**user_item_modified))
-    await async_session.commit()
+    await bulk_seed(
+        async_session,
+        {
+            TierModel: test_data_tier,
+            CategoryModel: test_data_category,
+            ModelTest: [{**user_item, "category_id": 1} for user_item in test_data],
+        },
+    )
 
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_joined(
+    result = await _CRUD_MODELTEST.get_joined(
         db=async_session,
         joins_config=[
             JoinConfig(
@@ -241,19 +185,15 @@ async def test_get_joined_multiple_models(
 async def test_get_joined_with_aliases(
     async_session, test_data, test_data_tier, test_data_category, test_data_booking
 ):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    for category_item in test_data_category:
-        async_session.add(CategoryModel(**category_item))
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    for booking_item in test_data_booking:
-        async_session.add(BookingModel(**booking_item))
-    await async_session.commit()
-
-    crud = FastCRUD(BookingModel)
+    await bulk_seed(
+        async_session,
+        {
+            TierModel: test_data_tier,
+            CategoryModel: test_data_category,
+            ModelTest: test_data,
+            BookingModel: test_data_booking,
+        },
+    )
 
     specific_booking_id = 1
     expected_owner_name = "Charlie"
@@ -262,7 +202,7 @@ async def test_get_joined_with_aliases(
     owner = aliased(ModelTest, name="owner")
     user = aliased(ModelTest, name="user")
 
-    result = await crud.get_joined(
+    result = await _CRUD_BOOKING.get_joined(
         db=async_session,
         schema_to_select=BookingSchema,
         joins_config=[
@@ -297,19 +237,15 @@ async def test_get_joined_with_aliases(
 async def test_get_joined_with_aliases_no_schema(
     async_session, test_data, test_data_tier, test_data_category, test_data_booking
 ):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    for category_item in test_data_category:
-        async_session.add(CategoryModel(**category_item))
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    for booking_item in test_data_booking:
-        async_session.add(BookingModel(**booking_item))
-    await async_session.commit()
-
-    crud = FastCRUD(BookingModel)
+    await bulk_seed(
+        async_session,
+        {
+            TierModel: test_data_tier,
+            CategoryModel: test_data_category,
+            ModelTest: test_data,
+            BookingModel: test_data_booking,
+        },
+    )
 
     specific_booking_id = 1
     expected_owner_name = "Charlie"
@@ -318,7 +254,7 @@ async def test_get_joined_with_aliases_no_schema(
     owner = aliased(ModelTest, name="owner")
     user = aliased(ModelTest, name="user")
 
-    result = await crud.get_joined(
+    result = await _CRUD_BOOKING.get_joined(
         db=async_session,
         schema_to_select=BookingSchema,
         joins_config=[
@@ -351,10 +287,8 @@ async def test_get_joined_with_aliases_no_schema(
 async def test_get_joined_with_both_single_and_joins_config_raises_value_error(
     async_session, test_data
 ):
-    crud = FastCRUD(ModelTest)
-
     with pytest.raises(ValueError) as excinfo:
-        await crud.get_joined(
+        await _CRUD_MODELTEST.get_joined(
             db=async_session,
             join_model=TierModel,
             joins_config=[
@@ -375,10 +309,8 @@ async def test_get_joined_with_both_single_and_joins_config_raises_value_error(
 async def test_get_joined_without_join_model_or_joins_config_raises_value_error(
     async_session, test_data
 ):
-    crud = FastCRUD(ModelTest)
-
     with pytest.raises(ValueError) as excinfo:
-        await crud.get_joined(db=async_session)
+        await _CRUD_MODELTEST.get_joined(db=async_session)
 
     assert "You need one of join_model or joins_config." in str(excinfo.value)
 
@@ -387,10 +319,8 @@ async def test_get_joined_without_join_model_or_joins_config_raises_value_error(
 async def test_get_joined_with_unsupported_join_type_raises_value_error(
     async_session, test_data
 ):
-    crud = FastCRUD(ModelTest)
-
     with pytest.raises(ValueError) as excinfo:
-        await crud.get_joined(
+        await _CRUD_MODELTEST.get_joined(
             db=async_session,
             join_model=TierModel,
             join_type="unsupported_type",
@@ -401,9 +331,7 @@ async def test_get_joined_with_unsupported_join_type_raises_value_error(
 
 @pytest.mark.asyncio
 async def test_get_joined_returns_none_when_no_record_matches(async_session, test_data):
-    crud = FastCRUD(ModelTest)
-
-    result = await crud.get_joined(
+    result = await _CRUD_MODELTEST.get_joined(
         db=async_session,
         join_model=TierModel,
         schema_to_select=CreateSchemaTest,
@@ -418,19 +346,11 @@ async def test_get_joined_returns_none_when_no_record_matches(async_session, tes
 async def test_get_joined_with_joined_model_filters(
     async_session, test_data, test_data_tier
 ):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
+    await bulk_seed(async_session, {TierModel: test_data_tier, ModelTest: test_data})
 
     join_filters = {"name": "Premium"}
 
-    result = await crud.get_joined(
+    result = await _CRUD_MODELTEST.get_joined(
         db=async_session,
         join_model=TierModel,
         join_filters=join_filters,
@@ -446,98 +366,8 @@ async def test_get_joined_with_joined_model_filters(
 
 
 @pytest.mark.asyncio
-async def test_get_joined_nest_joins(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-
-    result = await crud.get_joined(
-        db=async_session,
-        join_model=TierModel,
-        join_prefix="tier_",
-        schema_to_select=CreateSchemaTest,
-        join_schema_to_select=TierSchemaTest,
-        nest_joins=True,
-    )
-
-    assert result is not None, "No result returned, expected a nested join result."
-    assert "name" in result, "Expected primary model field 'name' in result."
-    assert "tier" in result, "Expected nested 'tier' key in result for joined fields."
-    assert (
-        "name" in result["tier"]
-    ), "Expected 'name' inside nested 'tier' dictionary from TierModel."
-    assert (
-        "tier_name" not in result
-    ), "'tier_name' should not be at the top level in the result."
-
-
-@pytest.mark.asyncio
-async def test_get_joined_nested_no_prefix_provided(
-    async_session, test_data, test_data_tier
-):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_joined(
-        db=async_session,
-        join_model=TierModel,
-        schema_to_select=CreateSchemaTest,
-        join_schema_to_select=TierSchemaTest,
-        nest_joins=True,
-    )
-
-    assert result is not None, "No result returned, expected a nested join result."
-    assert "name" in result, "Expected primary model field 'name' in result."
-    assert (
-        "name" in result[TierModel.__tablename__]
-    ), f"Expected 'name' field inside nested '{TierModel.__tablename__}' dictionary."
-
-
-@pytest.mark.asyncio
-async def test_get_joined_no_prefix_no_nesting(
-    async_session, test_data, test_data_tier
-):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-
-    result = await crud.get_joined(
-        db=async_session,
-        join_model=TierModel,
-        schema_to_select=CreateSchemaTest,
-        join_schema_to_select=TierSchemaTest,
-    )
-
-    assert result is not None, "Expected to retrieve a result from joined query."
-    assert (
-        "name" in result
-    ), "Expected 'name' field from the primary model in the result."
-    assert "tier_id" in result, "Expected 'tier_id' (foreign key) in the result."
-    assert (
-        "tier_name" not in result
-    ), "Field 'tier_name' should not exist unless specifically prefixed or nested."
-
-
-@pytest.mark.asyncio
-async def test_get_joined_card_with_articles(async_session):
+@pytest.mark.parametrize("load_strategy", ["join", "selectin"])
+async def test_get_joined_card_with_articles(async_session, load_strategy):
     card = Card(title="Test Card")
     async_session.add(card)
     async_session.add_all(
@@ -549,9 +379,7 @@ async def test_get_joined_card_with_articles(async_session):
     )
     await async_session.commit()
 
-    card_crud = FastCRUD(Card)
-
-    result = await card_crud.get_joined(
+    result = await _CRUD_CARD.get_joined(
         db=async_session,
         nest_joins=True,
         joins_config=[
@@ -561,6 +389,7 @@ async def test_get_joined_card_with_articles(async_session):
                 join_prefix="articles_",
                 join_type="left",
                 relationship_type="one-to-many",
+                load_strategy=load_strategy,
             )
         ],
     )
@@ -579,61 +408,59 @@ async def test_get_joined_card_with_articles(async_session):
 async def test_get_joined_nested_data_none_dict(async_session):
     clients = [
         Client(
+            id=1,
             name="Client A",
             contact="Contact A",
             phone="111-111-1111",
             email="a@client.com",
         ),
         Client(
+            id=2,
             name="Client B",
             contact="Contact B",
             phone="222-222-2222",
             email="b@client.com",
         ),
     ]
-    async_session.add_all(clients)
-    await async_session.flush()
-
     departments = [
-        Department(name="Department A"),
-        Department(name="Department B"),
+        Department(id=1, name="Department A"),
+        Department(id=2, name="Department B"),
     ]
-    async_session.add_all(departments)
-    await async_session.flush()
-
     users = [
         User(
+            id=1,
             name="User A",
             username="usera",
             email="usera@example.com",
             phone="123-123-1234",
         ),
         User(
+            id=2,
             name="User B",
             username="userb",
             email="userb@example.com",
             phone="234-234-2345",
         ),
     ]
-    async_session.add_all(users)
-    await async_session.flush()
-
     tasks = [
         Task(
+            id=1,
             name="Task 1",
             description="Task 1 Description",
-            client_id=clients[0].id,
-            department_id=departments[0].id,
-            assignee_id=users[0].id,
+            client_id=1,
+            department_id=1,
+            assignee_id=1,
         ),
         Task(
+            id=2,
             name="Task 2",
             description="Task 2 Description",
-            client_id=clients[1].id,
-            department_id=departments[1].id,
-            assignee_id=users[1].id,
+            client_id=2,
+            department_id=2,
+            assignee_id=2,
         ),
         Task(
+            id=3,
             name="Task 3",
             description="Task 3 Description",
             client_id=None,
@@ -641,11 +468,9 @@ async def test_get_joined_nested_data_none_dict(async_session):
             assignee_id=None,
         ),
     ]
-    async_session.add_all(tasks)
+    async_session.add_all(clients + departments + users + tasks)
     await async_session.commit()
 
-    task_crud = FastCRUD(Task)
-
     joins_config = [
         JoinConfig(
             model=Client,
@@ -670,7 +495,7 @@ async def test_get_joined_nested_data_none_dict(async_session):
         ),
     ]
 
-    task1_result = await task_crud.get_joined(
+    task1_result = await _CRUD_TASK.get_joined(
         db=async_session,
         id=tasks[0].id,
         schema_to_select=TaskRead,
@@ -692,7 +517,7 @@ async def test_get_joined_nested_data_none_dict(async_session):
     assert task1_result["department"] is not None, "Task 1 should have a department."
     assert task1_result["assignee"] is not None, "Task 1 should have an assignee."
 
-    task3_result = await task_crud.get_joined(
+    task3_result = await _CRUD_TASK.get_joined(
         db=async_session,
         id=tasks[2].id,
         schema_to_select=TaskRead,
@@ -713,3 +538,83 @@ async def test_get_joined_nested_data_none_dict(async_session):
     assert task3_result["client"] is None, "Task 3 should have no client."
     assert task3_result["department"] is None, "Task 3 should have no department."
     assert task3_result["assignee"] is None, "Task 3 should have no assignee."
+
+
+@pytest.mark.asyncio
+async def test_get_joined_many(seeded_session, test_data):
+    first, third = test_data[0], test_data[2]
+
+    results = await _CRUD_MODELTEST.get_joined_many(
+        db=seeded_session,
+        ids=[first["id"], third["id"], 999],
+        schema_to_select=ReadSchemaTest,
+        joins_config=_TIER_JOINS,
+        nest_joins=True,
+    )
+
+    assert set(results) == {first["id"], third["id"]}, "Missing ids are omitted."
+    for item in (first, third):
+        result = results[item["id"]]
+        assert result["name"] == item["name"]
+        assert result["tier"]["name"] is not None
+
+
+@pytest.mark.asyncio
+async def test_get_joined_many_one_to_many(async_session):
+    cards = [Card(title="Card A"), Card(title="Card B")]
+    async_session.add_all(
+        cards
+        + [
+            Article(title="Article 1", card=cards[0]),
+            Article(title="Article 2", card=cards[0]),
+            Article(title="Article 3", card=cards[1]),
+        ]
+    )
+    await async_session.commit()
+
+    params = dict(
+        db=async_session,
+        ids=[card.id for card in cards],
+        joins_config=[
+            JoinConfig(
+                model=Article,
+                join_on=Article.card_id == Card.id,
+                join_prefix="articles_",
+                relationship_type="one-to-many",
+            )
+        ],
+    )
+    results = await _CRUD_CARD.get_joined_many(nest_joins=True, **params)
+
+    assert sorted(a["title"] for a in results[cards[0].id]["articles"]) == [
+        "Article 1",
+        "Article 2",
+    ]
+    assert [a["title"] for a in results[cards[1].id]["articles"]] == ["Article 3"]
+
+    with pytest.raises(ValueError, match="nest_joins=False"):
+        await _CRUD_CARD.get_joined_many(nest_joins=False, **params)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "crud, kwargs, match",
+    [
+        pytest.param(_CRUD_MODELTEST, {}, "joins_config is required", id="no_joins"),
+        pytest.param(
+            FastCRUD(MultiPkModel),
+            {"joins_config": _TIER_JOINS},
+            "single-column primary key",
+            id="composite_pk",
+        ),
+        pytest.param(
+            _CRUD_MODELTEST,
+            {"joins_config": _TIER_JOINS, "schema_to_select": CreateSchemaTest},
+            "must include the primary key",
+            id="schema_without_pk",
+        ),
+    ],
+)
+async def test_get_joined_many_invalid_arguments(async_session, crud, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        await crud.get_joined_many(db=async_session, ids=[1], **kwargs)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter
+from fastapi.routing import APIRoute
+
+from fastcrud import EndpointCreator
+
+
+def test_endpoints_reused_across_routers(endpoint_creator: EndpointCreator):
+    endpoint_creator.add_routes_to_router()
+    first_endpoints = {
+        route.path: route.endpoint
+        for route in endpoint_creator.router.routes
+        if isinstance(route, APIRoute)
+    }
+
+    endpoint_creator.router = APIRouter()
+    endpoint_creator.add_routes_to_router()
+    second_endpoints = {
+        route.path: route.endpoint
+        for route in endpoint_creator.router.routes
+        if isinstance(route, APIRoute)
+    }
+
+    assert first_endpoints.keys() == second_endpoints.keys()
+    for path, endpoint in first_endpoints.items():
+        assert second_endpoints[path] is endpoint
@@ -8,7 +8,7 @@ from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import make_url
+from sqlalchemy import insert, make_url
 from pydantic import ConfigDict
 from sqlmodel import SQLModel, Field, Relationship
 from fastapi import FastAPI
@@ -287,7 +287,7 @@ async_engine = create_async_engine(
 
 @asynccontextmanager
 async def _setup_database(url: str) -> AsyncGenerator[AsyncSession]:
-    engine = create_async_engine(url, echo=True, future=True)
+    engine = create_async_engine(url, echo=False, future=True)
     session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     async with session_maker() as session:
         async with engine.begin() as conn:
@@ -295,8 +295,11 @@ async def _setup_database(url: str) -> AsyncGenerator[AsyncSession]:
         try:
             yield session
         finally:
-            async with engine.begin() as conn:
-                await conn.run_sync(SQLModel.metadata.drop_all)
+            # An in-memory SQLite database disappears with its connection, so
+            # only server-backed databases need their tables dropped.
+            if engine.url.database not in (None, "", ":memory:"):
+                async with engine.begin() as conn:
+                    await conn.run_sync(SQLModel.metadata.drop_all)
     await engine.dispose()
 
 
@@ -384,6 +387,43 @@ def test_data_booking() -> list[dict]:
     ]
 
 
+async def bulk_seed(session: AsyncSession, mapping: dict) -> None:
+    """Insert each model's rows with one executemany and commit once."""
+    for model, rows in mapping.items():
+        await session.execute(insert(model), rows)
+    await session.commit()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def seeded_session(
+    async_session: AsyncSession, test_data: list[dict], test_data_tier: list[dict]
+) -> AsyncSession:
+    """Session with the tier and test rows already committed."""
+    await bulk_seed(async_session, {TierModel: test_data_tier, ModelTest: test_data})
+    return async_session
+
+
+@pytest_asyncio.fixture(scope="function")
+async def seeded_booking_session(
+    async_session: AsyncSession,
+    test_data: list[dict],
+    test_data_tier: list[dict],
+    test_data_category: list[dict],
+    test_data_booking: list[dict],
+) -> AsyncSession:
+    """Session with the tier, category, test and booking rows already committed."""
+    await bulk_seed(
+        async_session,
+        {
+            TierModel: test_data_tier,
+            CategoryModel: test_data_category,
+            ModelTest: test_data,
+            BookingModel: test_data_booking,
+        },
+    )
+    return async_session
+
+
 @pytest.fixture
 def test_model():
     return ModelTest
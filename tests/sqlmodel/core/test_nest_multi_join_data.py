@@ -48,8 +48,9 @@ async def test_nest_multi_join_data_new_row_none(async_session):
     assert result is not None, "No data returned from the database."
     assert "data" in result, "Result should contain 'data' key."
     data = result["data"]
+    by_id = {c["id"]: c for c in data}
 
-    card_a = next((c for c in data if c["id"] == cards[0].id), None)
+    card_a = by_id.get(cards[0].id)
     assert (
         card_a is not None and "articles" in card_a
     ), "Card A should have nested articles."
@@ -58,7 +59,7 @@ async def test_nest_multi_join_data_new_row_none(async_session):
         card_a["articles"][0]["title"] == "Article 1"
     ), "Card A's article title should be 'Article 1'."
 
-    card_b = next((c for c in data if c["id"] == cards[1].id), None)
+    card_b = by_id.get(cards[1].id)
     assert (
         card_b is not None and "articles" in card_b
     ), "Card B should have nested articles."
@@ -1,8 +1,12 @@
 from typing import Annotated
+from unittest.mock import MagicMock
 import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastcrud import FastCRUD, JoinConfig, aliased
 from pydantic import BaseModel, Field
 from ...sqlmodel.conftest import (
+    bulk_seed,
     ModelTest,
     TierModel,
     CreateSchemaTest,
@@ -30,6 +34,77 @@ from ...sqlmodel.conftest import (
 )
 
 
+_CRUD_MODELTEST = FastCRUD(ModelTest)
+_CRUD_BOOKING = FastCRUD(BookingModel)
+_CRUD_CARD = FastCRUD(Card)
+_CRUD_PROJECT = FastCRUD(Project)
+_CRUD_TASK = FastCRUD(Task)
+
+
+_TIER_CATEGORY_JOINS = [
+    JoinConfig(
+        model=TierModel,
+        join_on=ModelTest.tier_id == TierModel.id,
+        join_prefix="tier_",
+        schema_to_select=TierSchemaTest,
+        join_type="left",
+    ),
+    JoinConfig(
+        model=CategoryModel,
+        join_on=ModelTest.category_id == CategoryModel.id,
+        join_prefix="category_",
+        schema_to_select=CategorySchemaTest,
+        join_type="left",
+    ),
+]
+_PROJECT_PARTICIPANT_JOINS = [
+    JoinConfig(
+        model=ProjectsParticipantsAssociation,
+        join_on=Project.id == ProjectsParticipantsAssociation.project_id,
+        join_type="inner",
+        join_prefix="pp_",
+    ),
+    JoinConfig(
+        model=Participant,
+        join_on=ProjectsParticipantsAssociation.participant_id == Participant.id,
+        join_type="inner",
+        join_prefix="participant_",
+    ),
+]
+_CARD_ARTICLES_JOINS = [
+    JoinConfig(
+        model=Article,
+        join_on=Article.card_id == Card.id,
+        join_prefix="articles_",
+        join_type="left",
+        relationship_type="one-to-many",
+    )
+]
+_TASK_JOINS = [
+    JoinConfig(
+        model=Client,
+        join_on=Task.client_id == Client.id,
+        join_prefix="client",
+        schema_to_select=ClientRead,
+        join_type="left",
+    ),
+    JoinConfig(
+        model=Department,
+        join_on=Task.department_id == Department.id,
+        join_prefix="department",
+        schema_to_select=DepartmentRead,
+        join_type="left",
+    ),
+    JoinConfig(
+        model=User,
+        join_on=Task.assignee_id == User.id,
+        join_prefix="assignee",
+        schema_to_select=UserReadSub,
+        join_type="left",
+    ),
+]
+
+
 class JoinedTestTier(BaseModel):
     name: str
     tier_id: int
@@ -41,19 +116,17 @@ class CustomCreateSchemaTest(BaseModel):
     tier_id: int
 
 
-@pytest.mark.asyncio
-async def test_get_multi_joined_basic(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
+def _assert_row_keys(rows, required):
+    """Assert that every row has the same keys and that they include `required`."""
+    key_sets = {frozenset(row) for row in rows}
+    assert len(key_sets) == 1, "Rows should share a single key set"
+    assert required <= next(iter(key_sets))
 
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
 
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_multi_joined(
-        db=async_session,
+@pytest.mark.asyncio
+async def test_get_multi_joined_basic(seeded_session, test_data):
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
         join_model=TierModel,
         join_prefix="tier_",
         schema_to_select=CreateSchemaTest,
@@ -64,22 +137,13 @@ async def test_get_multi_joined_basic(async_session, test_data, test_data_tier):
 
     assert len(result["data"]) == min(10, len(test_data))
     assert result["total_count"] == len(test_data)
-    assert all("tier_name" in item for item in result["data"])
+    _assert_row_keys(result["data"], {"tier_name"})
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_unpaginated(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_multi_joined(
-        db=async_session,
+async def test_get_multi_joined_unpaginated(seeded_session, test_data):
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
         join_model=TierModel,
         join_prefix="tier_",
         schema_to_select=CreateSchemaTest,
@@ -90,22 +154,13 @@ async def test_get_multi_joined_unpaginated(async_session, test_data, test_data_
 
     assert len(result["data"]) == len(test_data)
     assert result["total_count"] == len(test_data)
-    assert all("tier_name" in item for item in result["data"])
+    _assert_row_keys(result["data"], {"tier_name"})
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_sorting(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_multi_joined(
-        db=async_session,
+async def test_get_multi_joined_sorting(seeded_session):
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
         join_model=TierModel,
         join_prefix="tier_",
         schema_to_select=CreateSchemaTest,
@@ -124,19 +179,10 @@ async def test_get_multi_joined_sorting(async_session, test_data, test_data_tier
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_filtering(async_session, test_data, test_data_tier):
+async def test_get_multi_joined_filtering(seeded_session):
     specific_user_name = "Charlie"
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_multi_joined(
-        db=async_session,
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
         join_model=TierModel,
         join_prefix="tier_",
         schema_to_select=CreateSchemaTest,
@@ -151,21 +197,10 @@ async def test_get_multi_joined_filtering(async_session, test_data, test_data_ti
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_different_join_types(
-    async_session, test_data, test_data_tier
-):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
+async def test_get_multi_joined_different_join_types(seeded_session):
     for join_type in ["left", "inner"]:
-        result = await crud.get_multi_joined(
-            db=async_session,
+        result = await _CRUD_MODELTEST.get_multi_joined(
+            db=seeded_session,
             join_model=TierModel,
             join_type=join_type,
             schema_to_select=CreateSchemaTest,
@@ -178,18 +213,25 @@ async def test_get_multi_joined_different_join_types(
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_return_model(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
+async def test_get_multi_joined_return_model(seeded_session):
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
+        join_model=TierModel,
+        schema_to_select=JoinedTestTier,
+        join_schema_to_select=TierSchemaTest,
+        join_prefix="tier_",
+        return_as_model=True,
+        offset=0,
+        limit=10,
+    )
 
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
+    assert all(isinstance(item, JoinedTestTier) for item in result["data"])
 
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_multi_joined(
-        db=async_session,
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_return_model_trusted(seeded_session):
+    params = dict(
+        db=seeded_session,
         join_model=TierModel,
         schema_to_select=JoinedTestTier,
         join_schema_to_select=TierSchemaTest,
@@ -198,23 +240,49 @@ async def test_get_multi_joined_return_model(async_session, test_data, test_data
         offset=0,
         limit=10,
     )
+    validated = await _CRUD_MODELTEST.get_multi_joined(**params)
+    trusted = await _CRUD_MODELTEST.get_multi_joined(**params, trust_db_types=True)
 
-    assert all(isinstance(item, JoinedTestTier) for item in result["data"])
+    assert all(isinstance(item, JoinedTestTier) for item in trusted["data"])
+    assert [item.model_dump() for item in trusted["data"]] == [
+        item.model_dump() for item in validated["data"]
+    ]
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_no_results(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
+async def test_iter_multi_joined_pages(seeded_session, test_data):
+    params = dict(
+        join_model=TierModel,
+        join_prefix="tier_",
+        schema_to_select=CreateSchemaTest,
+        join_schema_to_select=TierSchemaTest,
+        sort_columns="id",
+    )
+    pages = [
+        page
+        async for page in _CRUD_MODELTEST.iter_multi_joined(
+            db=seeded_session, page_size=3, **params
+        )
+    ]
+    expected = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session, limit=None, **params
+    )
 
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
+    assert [len(page) for page in pages[:-1]] == [3] * (len(pages) - 1)
+    assert [row for page in pages for row in page] == expected["data"]
+    assert len(expected["data"]) == len(test_data)
 
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_multi_joined(
-        db=async_session,
+    with pytest.raises(ValueError, match="managed by iter_multi_joined"):
+        async for _ in _CRUD_MODELTEST.iter_multi_joined(
+            db=seeded_session, offset=5, **params
+        ):
+            pass  # pragma: no cover
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_no_results(seeded_session):
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
         join_model=TierModel,
         schema_to_select=CreateSchemaTest,
         join_schema_to_select=TierSchemaTest,
@@ -228,18 +296,9 @@ async def test_get_multi_joined_no_results(async_session, test_data, test_data_t
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_large_offset(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_multi_joined(
-        db=async_session,
+async def test_get_multi_joined_large_offset(seeded_session):
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
         join_model=TierModel,
         schema_to_select=CreateSchemaTest,
         join_schema_to_select=TierSchemaTest,
@@ -251,21 +310,10 @@ async def test_get_multi_joined_large_offset(async_session, test_data, test_data
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_invalid_limit_offset(
-    async_session, test_data, test_data_tier
-):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
+async def test_get_multi_joined_invalid_limit_offset(seeded_session):
     with pytest.raises(ValueError):
-        await crud.get_multi_joined(
-            db=async_session,
+        await _CRUD_MODELTEST.get_multi_joined(
+            db=seeded_session,
             join_model=TierModel,
             schema_to_select=CreateSchemaTest,
             join_schema_to_select=TierSchemaTest,
@@ -273,8 +321,8 @@ async def test_get_multi_joined_invalid_limit_offset(
             limit=10,
         )
     with pytest.raises(ValueError):
-        await crud.get_multi_joined(
-            db=async_session,
+        await _CRUD_MODELTEST.get_multi_joined(
+            db=seeded_session,
             join_model=TierModel,
             schema_to_select=CreateSchemaTest,
             join_schema_to_select=TierSchemaTest,
@@ -284,20 +332,9 @@ async def test_get_multi_joined_invalid_limit_offset(
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_advanced_filtering(
-    async_session, test_data, test_data_tier
-):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-    advanced_filter_result = await crud.get_multi_joined(
-        db=async_session,
+async def test_get_multi_joined_advanced_filtering(seeded_session):
+    advanced_filter_result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
         join_model=TierModel,
         schema_to_select=ReadSchemaTest,
         join_schema_to_select=TierSchemaTest,
@@ -317,39 +354,13 @@ async def test_get_multi_joined_advanced_filtering(
 
 @pytest.mark.asyncio
 async def test_get_multi_joined_with_additional_join_model(
-    async_session, test_data, test_data_tier, test_data_category
+    seeded_session, test_data, test_data_category
 ):
-    for category_item in test_data_category:
-        async_session.add(CategoryModel(**category_item))
-    await async_session.commit()
-
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
+    await bulk_seed(seeded_session, {CategoryModel: test_data_category})
 
-    crud = FastCRUD(ModelTest)
-    result = await crud.get_multi_joined(
-        db=async_session,
-        joins_config=[
-            JoinConfig(
-                model=TierModel,
-                join_prefix="tier_",
-                schema_to_select=TierSchemaTest,
-                join_on=ModelTest.tier_id == TierModel.id,
-                join_type="left",
-            ),
-            JoinConfig(
-                model=CategoryModel,
-                join_prefix="category_",
-                schema_to_select=CategorySchemaTest,
-                join_on=ModelTest.category_id == CategoryModel.id,
-                join_type="left",
-            ),
-        ],
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
+        joins_config=_TIER_CATEGORY_JOINS,
         schema_to_select=ReadSchemaTest,
         offset=0,
         limit=10,
@@ -357,103 +368,22 @@ async def test_get_multi_joined_with_additional_join_model(
 
     assert len(result["data"]) == min(10, len(test_data))
     assert result["total_count"] == len(test_data)
-    assert all(
-        "tier_name" in item and "category_name" in item for item in result["data"]
-    )
+    _assert_row_keys(result["data"], {"tier_name", "category_name"})
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_with_aliases(
-    async_session, test_data, test_data_tier, test_data_category, test_data_booking
-):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    for category_item in test_data_category:
-        async_session.add(CategoryModel(**category_item))
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    for booking_item in test_data_booking:
-        async_session.add(BookingModel(**booking_item))
-    await async_session.commit()
-
-    crud = FastCRUD(BookingModel)
-
-    expected_owner_name = "Charlie"
-    expected_user_name = "Alice"
-
-    owner_alias = aliased(ModelTest, name="owner")
-    user_alias = aliased(ModelTest, name="user")
-
-    result = await crud.get_multi_joined(
-        db=async_session,
-        schema_to_select=BookingSchema,
-        joins_config=[
-            JoinConfig(
-                model=ModelTest,
-                join_on=BookingModel.owner_id == owner_alias.id,
-                join_prefix="owner_",
-                alias=owner_alias,
-                schema_to_select=ReadSchemaTest,
-            ),
-            JoinConfig(
-                model=ModelTest,
-                join_on=BookingModel.user_id == user_alias.id,
-                join_prefix="user_",
-                alias=user_alias,
-                schema_to_select=ReadSchemaTest,
-            ),
-        ],
-        offset=0,
-        limit=10,
-        sort_columns=["booking_date"],
-        sort_orders=["asc"],
-    )
-
-    assert "data" in result and isinstance(
-        result["data"], list
-    ), "The result should have a 'data' key with a list of records."
-    for booking in result["data"]:
-        assert (
-            "owner_name" in booking
-        ), "Each record should include 'owner_name' from the joined owner ModelTest data."
-        assert (
-            "user_name" in booking
-        ), "Each record should include 'user_name' from the joined user ModelTest data."
-    assert result is not None
-    assert result["total_count"] >= 1, "Expected at least one booking record"
-    first_result = result["data"][0]
-    assert (
-        first_result["owner_name"] == expected_owner_name
-    ), "Owner name does not match expected value"
-    assert (
-        first_result["user_name"] == expected_user_name
-    ), "User name does not match expected value"
-
-
-@pytest.mark.asyncio
-async def test_get_multi_joined_with_aliases_no_schema(
-    async_session, test_data, test_data_tier, test_data_category, test_data_booking
-):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    for category_item in test_data_category:
-        async_session.add(CategoryModel(**category_item))
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    for booking_item in test_data_booking:
-        async_session.add(BookingModel(**booking_item))
-    await async_session.commit()
-
-    crud = FastCRUD(BookingModel)
-
+@pytest.mark.parametrize(
+    "join_schema", [ReadSchemaTest, None], ids=["with_schema", "no_schema"]
+)
+async def test_get_multi_joined_with_aliases(seeded_booking_session, join_schema):
     expected_owner_name = "Charlie"
     expected_user_name = "Alice"
 
     owner_alias = aliased(ModelTest, name="owner")
     user_alias = aliased(ModelTest, name="user")
 
-    result = await crud.get_multi_joined(
-        db=async_session,
+    result = await _CRUD_BOOKING.get_multi_joined(
+        db=seeded_booking_session,
         schema_to_select=BookingSchema,
         joins_config=[
             JoinConfig(
@@ -461,12 +391,14 @@ async def test_get_multi_joined_with_aliases_no_schema(
                 join_on=BookingModel.owner_id == owner_alias.id,
                 join_prefix="owner_",
                 alias=owner_alias,
+                schema_to_select=join_schema,
             ),
             JoinConfig(
                 model=ModelTest,
                 join_on=BookingModel.user_id == user_alias.id,
                 join_prefix="user_",
                 alias=user_alias,
+                schema_to_select=join_schema,
             ),
         ],
         offset=0,
@@ -498,53 +430,28 @@ async def test_get_multi_joined_with_aliases_no_schema(
 
 @pytest.mark.asyncio
 async def test_many_to_many_joined(async_session):
-    project1 = Project(id=1, name="Project 1", description="First Project")
-    project2 = Project(id=2, name="Project 2", description="Second Project")
-
-    participant1 = Participant(id=1, name="Participant 1", role="Developer")
-    participant2 = Participant(id=2, name="Participant 2", role="Designer")
-
-    async_session.add_all([project1, project2, participant1, participant2])
-    await async_session.commit()
-
-    projects_participants1 = ProjectsParticipantsAssociation(
-        project_id=1, participant_id=1
-    )
-    projects_participants2 = ProjectsParticipantsAssociation(
-        project_id=1, participant_id=2
-    )
-    projects_participants3 = ProjectsParticipantsAssociation(
-        project_id=2, participant_id=1
-    )
-
-    async_session.add_all(
-        [projects_participants1, projects_participants2, projects_participants3]
+    await bulk_seed(
+        async_session,
+        {
+            Project: [
+                {"id": 1, "name": "Project 1", "description": "First Project"},
+                {"id": 2, "name": "Project 2", "description": "Second Project"},
+            ],
+            Participant: [
+                {"id": 1, "name": "Participant 1", "role": "Developer"},
+                {"id": 2, "name": "Participant 2", "role": "Designer"},
+            ],
+            ProjectsParticipantsAssociation: [
+                {"project_id": 1, "participant_id": 1},
+                {"project_id": 1, "participant_id": 2},
+                {"project_id": 2, "participant_id": 1},
+            ],
+        },
     )
-    await async_session.commit()
-
-    crud_project = FastCRUD(Project)
-
-    join_condition_1 = Project.id == ProjectsParticipantsAssociation.project_id
-    join_condition_2 = ProjectsParticipantsAssociation.participant_id == Participant.id
-
-    joins_config = [
-        JoinConfig(
-            model=ProjectsParticipantsAssociation,
-            join_on=join_condition_1,
-            join_type="inner",
-            join_prefix="pp_",
-        ),
-        JoinConfig(
-            model=Participant,
-            join_on=join_condition_2,
-            join_type="inner",
-            join_prefix="participant_",
-        ),
-    ]
 
-    records = await crud_project.get_multi_joined(
+    records = await _CRUD_PROJECT.get_multi_joined(
         db=async_session,
-        joins_config=joins_config,
+        joins_config=_PROJECT_PARTICIPANT_JOINS,
     )
 
     expected_results = [
@@ -573,27 +480,32 @@ async def test_many_to_many_joined(async_session):
         len(records["data"]) == records["total_count"]
     ), "Number of records should be the same in total_count and len"
 
-    for expected, actual in zip(expected_results, records["data"]):
-        assert (
-            actual["id"] == expected["project_id"]
-        ), f"Project ID mismatch. Expected: {expected['project_id']}, Got: {actual['id']}"
-        assert (
-            actual["participant_id"] == expected["participant_id"]
-        ), f"Participant ID mismatch. Expected: {expected['participant_id']}, Got: {actual['participant_id']}"
-        assert (
-            actual["participant_name"] == expected["participant_name"]
-        ), f"Participant name mismatch. Expected: {expected['participant_name']}, Got: {actual['participant_name']}"
-        assert (
-            actual["participant_role"] == expected["participant_role"]
-        ), f"Participant role mismatch. Expected: {expected['participant_role']}, Got: {actual['participant_role']}"
+    expected_set = {
+        (
+            expected["project_id"],
+            expected["participant_id"],
+            expected["participant_name"],
+            expected["participant_role"],
+        )
+        for expected in expected_results
+    }
+    actual_set = {
+        (
+            actual["id"],
+            actual["participant_id"],
+            actual["participant_name"],
+            actual["participant_role"],
+        )
+        for actual in records["data"]
+    }
+    assert actual_set == expected_set, "Project-participant associations mismatch"
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_conflicting_join_parameters(async_session):
-    crud = FastCRUD(ModelTest)
+async def test_get_multi_joined_conflicting_join_parameters():
     with pytest.raises(ValueError) as exc_info:
-        await crud.get_multi_joined(
-            db=async_session,
+        await _CRUD_MODELTEST.get_multi_joined(
+            db=MagicMock(spec=AsyncSession),
             join_model=TierModel,
             joins_config=[
                 JoinConfig(model=TierModel, join_on=TierModel.id == ModelTest.tier_id)
@@ -606,19 +518,17 @@ async def test_get_multi_joined_conflicting_join_parameters(async_session):
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_missing_join_parameters(async_session):
-    crud = FastCRUD(ModelTest)
+async def test_get_multi_joined_missing_join_parameters():
     with pytest.raises(ValueError) as exc_info:
-        await crud.get_multi_joined(db=async_session)
+        await _CRUD_MODELTEST.get_multi_joined(db=MagicMock(spec=AsyncSession))
     assert "You need one of join_model or joins_config" in str(exc_info.value)
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_unsupported_join_type(async_session, test_data):
-    crud = FastCRUD(ModelTest)
+async def test_get_multi_joined_unsupported_join_type():
     with pytest.raises(ValueError) as exc_info:
-        await crud.get_multi_joined(
-            db=async_session,
+        await _CRUD_MODELTEST.get_multi_joined(
+            db=MagicMock(spec=AsyncSession),
             join_model=TierModel,
             join_type="unsupported_join_type",
         )
@@ -626,21 +536,9 @@ async def test_get_multi_joined_unsupported_join_type(async_session, test_data):
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_with_joined_model_filters(
-    async_session, test_data, test_data_tier
-):
-    for tier_data in test_data_tier:
-        async_session.add(TierModel(**tier_data))
-    await async_session.commit()
-
-    for test_item in test_data:
-        async_session.add(ModelTest(**test_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-
-    result = await crud.get_multi_joined(
-        db=async_session,
+async def test_get_multi_joined_with_joined_model_filters(seeded_session):
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
         join_model=TierModel,
         join_filters={"name": "Premium"},
         schema_to_select=ReadSchemaTest,
@@ -661,13 +559,10 @@ async def test_get_multi_joined_with_joined_model_filters(
 
 @pytest.mark.asyncio
 async def test_get_multi_joined_missing_schema_to_select(async_session, test_data):
-    for test_item in test_data:
-        async_session.add(ModelTest(**test_item))
-    await async_session.commit()
+    await bulk_seed(async_session, {ModelTest: test_data})
 
-    crud = FastCRUD(ModelTest)
     with pytest.raises(ValueError) as exc_info:
-        await crud.get_multi_joined(
+        await _CRUD_MODELTEST.get_multi_joined(
             db=async_session,
             join_model=TierModel,
             return_as_model=True,
@@ -678,28 +573,17 @@ async def test_get_multi_joined_missing_schema_to_select(async_session, test_dat
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_validation_error(
-    async_session, test_data, test_model, test_data_tier
-):
-    for tier_data in test_data_tier:
-        async_session.add(TierModel(**tier_data))
-    await async_session.commit()
-
-    for test_item in test_data:
-        async_session.add(ModelTest(**test_item))
-    await async_session.commit()
-
+async def test_get_multi_joined_validation_error(seeded_session, test_model):
     invalid_test_data = {
         "name": "Extremely Long Name That Exceeds The Limits Of CustomCreateSchemaTest",
         "tier_id": 1,
     }
-    async_session.add(test_model(**invalid_test_data))
-    await async_session.commit()
+    seeded_session.add(test_model(**invalid_test_data))
+    await seeded_session.flush()
 
-    crud = FastCRUD(ModelTest)
     with pytest.raises(ValueError) as exc_info:
-        await crud.get_multi_joined(
-            db=async_session,
+        await _CRUD_MODELTEST.get_multi_joined(
+            db=seeded_session,
             join_model=TierModel,
             return_as_model=True,
             schema_to_select=CustomCreateSchemaTest,
@@ -711,35 +595,10 @@ async def test_get_multi_joined_validation_error(
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_with_nesting(async_session, test_data, test_data_tier):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-
-    result = await crud.get_multi_joined(
-        db=async_session,
-        joins_config=[
-            JoinConfig(
-                model=TierModel,
-                join_on=ModelTest.tier_id == TierModel.id,
-                join_prefix="tier_",
-                schema_to_select=TierSchemaTest,
-                join_type="left",
-            ),
-            JoinConfig(
-                model=CategoryModel,
-                join_on=ModelTest.category_id == CategoryModel.id,
-                join_prefix="category_",
-                schema_to_select=CategorySchemaTest,
-                join_type="left",
-            ),
-        ],
+async def test_get_multi_joined_with_nesting(seeded_session):
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
+        joins_config=_TIER_CATEGORY_JOINS,
         schema_to_select=CreateSchemaTest,
         nest_joins=True,
         offset=0,
@@ -773,99 +632,57 @@ async def test_get_multi_joined_with_nesting(async_session, test_data, test_data
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_no_prefix_regular(
-    async_session, test_data, test_data_tier
-):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-
-    result = await crud.get_multi_joined(
-        db=async_session,
-        join_model=TierModel,
-        schema_to_select=CreateSchemaTest,
-        join_schema_to_select=TierSchemaTest,
-        limit=10,
-    )
-
-    assert result and result["data"], "Expected data in the result."
-    for item in result["data"]:
-        assert "name" in item, "Expected user name in each item."
-        assert "name_1" in item, "Expected tier name in each item without prefix."
-
-
-@pytest.mark.asyncio
-async def test_get_multi_joined_no_prefix_nested(
-    async_session, test_data, test_data_tier
-):
-    for tier_item in test_data_tier:
-        async_session.add(TierModel(**tier_item))
-    await async_session.commit()
-
-    for user_item in test_data:
-        async_session.add(ModelTest(**user_item))
-    await async_session.commit()
-
-    crud = FastCRUD(ModelTest)
-
-    result = await crud.get_multi_joined(
-        db=async_session,
+@pytest.mark.parametrize("nest_joins", [False, True], ids=["regular", "nested"])
+async def test_get_multi_joined_no_prefix(seeded_session, nest_joins):
+    result = await _CRUD_MODELTEST.get_multi_joined(
+        db=seeded_session,
         join_model=TierModel,
         schema_to_select=CreateSchemaTest,
         join_schema_to_select=TierSchemaTest,
-        nest_joins=True,
+        nest_joins=nest_joins,
         limit=10,
     )
 
     assert result and result["data"], "Expected data in the result."
     for item in result["data"]:
         assert "name" in item, "Expected user name in each item."
-        assert (
-            TierModel.__tablename__ in item
-        ), f"Expected nested '{TierModel.__tablename__}' key in each item."
-        assert (
-            "name" in item[TierModel.__tablename__]
-        ), f"Expected 'name' field inside nested '{TierModel.__tablename__}' dictionary."
+        if nest_joins:
+            assert (
+                TierModel.__tablename__ in item
+            ), f"Expected nested '{TierModel.__tablename__}' key in each item."
+            assert (
+                "name" in item[TierModel.__tablename__]
+            ), f"Expected 'name' field inside nested '{TierModel.__tablename__}' dictionary."
+        else:
+            assert "name_1" in item, "Expected tier name in each item without prefix."
 
 
 @pytest.mark.asyncio
 async def test_get_multi_joined_card_with_articles(async_session):
-    cards = [
-        Card(title="Test Card"),
-        Card(title="Test Card 2"),
-        Card(title="Test Card 3"),
-    ]
-    async_session.add_all(cards)
-    await async_session.flush()
-
-    articles = [
-        Article(title="Article 1", card_id=cards[0].id),
-        Article(title="Article 2", card_id=cards[1].id),
-        Article(title="Article 3", card_id=cards[1].id),
-    ]
-    async_session.add_all(articles)
-    await async_session.commit()
-
-    card_crud = FastCRUD(Card)
+    inserted_cards = await async_session.execute(
+        insert(Card).returning(Card.id, sort_by_parameter_order=True),
+        [
+            {"title": "Test Card"},
+            {"title": "Test Card 2"},
+            {"title": "Test Card 3"},
+        ],
+    )
+    card_ids = inserted_cards.scalars().all()
+    await bulk_seed(
+        async_session,
+        {
+            Article: [
+                {"title": "Article 1", "card_id": card_ids[0]},
+                {"title": "Article 2", "card_id": card_ids[1]},
+                {"title": "Article 3", "card_id": card_ids[1]},
+            ]
+        },
+    )
 
-    result = await card_crud.get_multi_joined(
+    result = await _CRUD_CARD.get_multi_joined(
         db=async_session,
         nest_joins=True,
-        joins_config=[
-            JoinConfig(
-                model=Article,
-                join_on=Article.card_id == Card.id,
-                join_prefix="articles_",
-                join_type="left",
-                relationship_type="one-to-many",
-            )
-        ],
+        joins_config=_CARD_ARTICLES_JOINS,
     )
 
     assert result is not None, "No data returned from the database."
@@ -874,9 +691,10 @@ async def test_get_multi_joined_card_with_articles(async_session):
     assert isinstance(data, list), "Result data should be a list."
     assert len(data) == 3, "Expected three card records."
 
-    card1 = next((c for c in data if c["id"] == cards[0].id), None)
-    card2 = next((c for c in data if c["id"] == cards[1].id), None)
-    card3 = next((c for c in data if c["id"] == cards[2].id), None)
+    by_id = {c["id"]: c for c in data}
+    card1 = by_id.get(card_ids[0])
+    card2 = by_id.get(card_ids[1])
+    card3 = by_id.get(card_ids[2])
 
     assert (
         card1 is not None and "articles" in card1
@@ -905,39 +723,33 @@ async def test_get_multi_joined_card_with_articles(async_session):
 
 @pytest.mark.asyncio
 async def test_get_multi_joined_card_with_multiple_articles(async_session):
-    cards = [
-        Card(title="Card A"),
-        Card(title="Card B"),
-        Card(title="Card C"),
-        Card(title="Card D"),
-    ]
-    async_session.add_all(cards)
-    await async_session.flush()
-
-    articles = [
-        Article(title="Article 1", card_id=cards[0].id),
-        Article(title="Article 2", card_id=cards[0].id),
-        Article(title="Article 3", card_id=cards[1].id),
-        Article(title="Article 4", card_id=cards[1].id),
-        Article(title="Article 5", card_id=cards[2].id),
-    ]
-    async_session.add_all(articles)
-    await async_session.commit()
-
-    card_crud = FastCRUD(Card)
+    inserted_cards = await async_session.execute(
+        insert(Card).returning(Card.id, sort_by_parameter_order=True),
+        [
+            {"title": "Card A"},
+            {"title": "Card B"},
+            {"title": "Card C"},
+            {"title": "Card D"},
+        ],
+    )
+    card_ids = inserted_cards.scalars().all()
+    await bulk_seed(
+        async_session,
+        {
+            Article: [
+                {"title": "Article 1", "card_id": card_ids[0]},
+                {"title": "Article 2", "card_id": card_ids[0]},
+                {"title": "Article 3", "card_id": card_ids[1]},
+                {"title": "Article 4", "card_id": card_ids[1]},
+                {"title": "Article 5", "card_id": card_ids[2]},
+            ]
+        },
+    )
 
-    result = await card_crud.get_multi_joined(
+    result = await _CRUD_CARD.get_multi_joined(
         db=async_session,
         nest_joins=True,
-        joins_config=[
-            JoinConfig(
-                model=Article,
-                join_on=Article.card_id == Card.id,
-                join_prefix="articles_",
-                join_type="left",
-                relationship_type="one-to-many",
-            )
-        ],
+        joins_config=_CARD_ARTICLES_JOINS,
     )
 
     assert result is not None, "No data returned from the database."
@@ -946,10 +758,11 @@ async def test_get_multi_joined_card_with_multiple_articles(async_session):
     assert isinstance(data, list), "Result data should be a list."
     assert len(data) == 4, "Expected four card records."
 
-    card_a = next((c for c in data if c["id"] == cards[0].id), None)
-    card_b = next((c for c in data if c["id"] == cards[1].id), None)
-    card_c = next((c for c in data if c["id"] == cards[2].id), None)
-    card_d = next((c for c in data if c["id"] == cards[3].id), None)
+    by_id = {c["id"]: c for c in data}
+    card_a = by_id.get(card_ids[0])
+    card_b = by_id.get(card_ids[1])
+    card_c = by_id.get(card_ids[2])
+    card_d = by_id.get(card_ids[3])
 
     assert (
         card_a is not None and "articles" in card_a
@@ -988,42 +801,41 @@ async def test_get_multi_joined_card_with_multiple_articles(async_session):
 
 
 @pytest.mark.asyncio
-async def test_get_multi_joined_card_with_multiple_articles_as_models(async_session):
-    cards = [
-        Card(title="Card A"),
-        Card(title="Card B"),
-        Card(title="Card C"),
-        Card(title="Card D"),
-    ]
-    async_session.add_all(cards)
-    await async_session.flush()
-
-    articles = [
-        Article(title="Article 1", card_id=cards[0].id),
-        Article(title="Article 2", card_id=cards[0].id),
-        Article(title="Article 3", card_id=cards[1].id),
-        Article(title="Article 4", card_id=cards[1].id),
-        Article(title="Article 5", card_id=cards[2].id),
-    ]
-    async_session.add_all(articles)
-    await async_session.commit()
-
-    card_crud = FastCRUD(Card)
+@pytest.mark.parametrize("load_strategy", ["join", "selectin"])
+async def test_get_multi_joined_card_with_multiple_articles_as_models(
+    async_session, load_strategy
+):
+    inserted_cards = await async_session.execute(
+        insert(Card).returning(Card.id, sort_by_parameter_order=True),
+        [
+            {"title": "Card A"},
+            {"title": "Card B"},
+            {"title": "Card C"},
+            {"title": "Card D"},
+        ],
+    )
+    card_ids = inserted_cards.scalars().all()
+    await bulk_seed(
+        async_session,
+        {
+            Article: [
+                {"title": "Article 1", "card_id": card_ids[0]},
+                {"title": "Article 2", "card_id": card_ids[0]},
+                {"title": "Article 3", "card_id": card_ids[1]},
+                {"title": "Article 4", "card_id": card_ids[1]},
+                {"title": "Article 5", "card_id": card_ids[2]},
+            ]
+        },
+    )
 
-    result = await card_crud.get_multi_joined(
+    result = await _CRUD_CARD.get_multi_joined(
         db=async_session,
         nest_joins=True,
         return_as_model=True,
         schema_to_select=CardSchema,
         nested_schema_to_select={"articles_": ArticleSchema},
         joins_config=[
-            JoinConfig(
-                model=Article,
-                join_on=Article.card_id == Card.id,
-                join_prefix="articles_",
-                join_type="left",
-                relationship_type="one-to-many",
-            )
+            _CARD_ARTICLES_JOINS[0].model_copy(update={"load_strategy": load_strategy})
         ],
     )
 
@@ -1036,13 +848,14 @@ async def test_get_multi_joined_card_with_multiple_articles_as_models(async_sess
         isinstance(card, CardSchema) for card in data
     ), "All items should be instances of CardSchema."
 
-    card_a = next((c for c in data if c.id == cards[0].id), None)
-    card_b = next((c for c in data if c.id == cards[1].id), None)
-    card_c = next((c for c in data if c.id == cards[2].id), None)
-    card_d = next((c for c in data if c.id == cards[3].id), None)
+    by_id = {c.id: c for c in data}
+    card_a = by_id.get(card_ids[0])
+    card_b = by_id.get(card_ids[1])
+    card_c = by_id.get(card_ids[2])
+    card_d = by_id.get(card_ids[3])
 
-    assert card_a is not None and hasattr(
-        card_a, "articles"
+    assert (
+        card_a is not None and card_a.articles is not None
     ), "Card A should have nested articles."
     assert len(card_a.articles) == 2, "Card A should have two articles."
     assert (
@@ -1051,12 +864,12 @@ async def test_get_multi_joined_card_with_multiple_articles_as_models(async_sess
     assert (
         card_a.articles[1].title == "Article 2"
     ), "Card A's second article title should be 'Article 2'."
-    assert all(
-        isinstance(article, ArticleSchema) for article in card_a.articles
-    ), "All articles in Card A should be instances of ArticleSchema."
+    assert isinstance(
+        card_a.articles[0], ArticleSchema
+    ), "Card A's articles should be ArticleSchema instances."
 
-    assert card_b is not None and hasattr(
-        card_b, "articles"
+    assert (
+        card_b is not None and card_b.articles is not None
     ), "Card B should have nested articles."
     assert len(card_b.articles) == 2, "Card B should have two articles."
     assert (
@@ -1065,27 +878,165 @@ async def test_get_multi_joined_card_with_multiple_articles_as_models(async_sess
     assert (
         card_b.articles[1].title == "Article 4"
     ), "Card B's second article title should be 'Article 4'."
-    assert all(
-        isinstance(article, ArticleSchema) for article in card_b.articles
-    ), "All articles in Card B should be instances of ArticleSchema."
+    assert isinstance(
+        card_b.articles[0], ArticleSchema
+    ), "Card B's articles should be ArticleSchema instances."
 
-    assert card_c is not None and hasattr(
-        card_c, "articles"
+    assert (
+        card_c is not None and card_c.articles is not None
     ), "Card C should have nested articles."
     assert len(card_c.articles) == 1, "Card C should have one article."
     assert (
         card_c.articles[0].title == "Article 5"
     ), "Card C's article title should be 'Article 5'."
-    assert all(
-        isinstance(article, ArticleSchema) for article in card_c.articles
-    ), "All articles in Card C should be instances of ArticleSchema."
+    assert isinstance(
+        card_c.articles[0], ArticleSchema
+    ), "Card C's articles should be ArticleSchema instances."
 
-    assert card_d is not None and hasattr(
-        card_d, "articles"
+    assert (
+        card_d is not None and card_d.articles is not None
     ), "Card D should have nested articles."
     assert len(card_d.articles) == 0, "Card D should have no articles."
 
 
+async def _seed_cards_with_articles(session):
+    inserted_cards = await session.execute(
+        insert(Card).returning(Card.id, sort_by_parameter_order=True),
+        [{"title": "Card A"}, {"title": "Card B"}, {"title": "Card C"}],
+    )
+    card_ids = inserted_cards.scalars().all()
+    await bulk_seed(
+        session,
+        {
+            Article: [
+                {"title": "Article 1", "card_id": card_ids[0]},
+                {"title": "Article 2", "card_id": card_ids[0]},
+                {"title": "Article 3", "card_id": card_ids[1]},
+                {"title": "Article 4", "card_id": card_ids[1]},
+            ]
+        },
+    )
+    return card_ids
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_selectin_paginates_parents(async_session):
+    card_ids = await _seed_cards_with_articles(async_session)
+
+    result = await _CRUD_CARD.get_multi_joined(
+        db=async_session,
+        nest_joins=True,
+        joins_config=[
+            _CARD_ARTICLES_JOINS[0].model_copy(update={"load_strategy": "selectin"})
+        ],
+        sort_columns="id",
+        limit=2,
+    )
+
+    assert [card["id"] for card in result["data"]] == list(card_ids[:2])
+    assert [len(card["articles"]) for card in result["data"]] == [2, 2]
+    assert result["total_count"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "join_update",
+    [
+        pytest.param({"join_type": "inner"}, id="inner"),
+        pytest.param({"filters": {"title": "Article 1"}}, id="filters"),
+    ],
+)
+async def test_get_multi_joined_selectin_falls_back_to_join(async_session, join_update):
+    await _seed_cards_with_articles(async_session)
+    join = _CARD_ARTICLES_JOINS[0].model_copy(update=join_update)
+
+    params = dict(db=async_session, nest_joins=True, sort_columns="id")
+    joined = await _CRUD_CARD.get_multi_joined(joins_config=[join], **params)
+    selectin = await _CRUD_CARD.get_multi_joined(
+        joins_config=[join.model_copy(update={"load_strategy": "selectin"})],
+        **params,
+    )
+
+    assert selectin == joined
+    assert all(card["articles"] for card in selectin["data"])
+
+
+@pytest.mark.asyncio
+async def test_iter_multi_joined_one_to_many(async_session):
+    card_ids = await _seed_cards_with_articles(async_session)
+    params = dict(db=async_session, page_size=2, nest_joins=True, sort_columns="id")
+
+    pages = [
+        page
+        async for page in _CRUD_CARD.iter_multi_joined(
+            joins_config=[
+                _CARD_ARTICLES_JOINS[0].model_copy(update={"load_strategy": "selectin"})
+            ],
+            **params,
+        )
+    ]
+
+    assert [[card["id"] for card in page] for page in pages] == [
+        list(card_ids[:2]),
+        [card_ids[2]],
+    ]
+    assert [len(card["articles"]) for page in pages for card in page] == [2, 2, 0]
+
+    with pytest.raises(ValueError, match="load_strategy='selectin'"):
+        async for _ in _CRUD_CARD.iter_multi_joined(
+            joins_config=_CARD_ARTICLES_JOINS, **params
+        ):
+            pass  # pragma: no cover
+
+
+@pytest.mark.asyncio
+async def test_get_multi_joined_card_with_articles_as_trusted_models(async_session):
+    inserted_cards = await async_session.execute(
+        insert(Card).returning(Card.id, sort_by_parameter_order=True),
+        [{"title": "Card A"}, {"title": "Card B"}],
+    )
+    card_ids = inserted_cards.scalars().all()
+    await bulk_seed(
+        async_session,
+        {
+            Article: [
+                {"title": "Article 1", "card_id": card_ids[0]},
+                {"title": "Article 2", "card_id": card_ids[0]},
+                {"title": "Article 3", "card_id": card_ids[1]},
+            ]
+        },
+    )
+
+    params = dict(
+        db=async_session,
+        nest_joins=True,
+        return_as_model=True,
+        schema_to_select=CardSchema,
+        joins_config=[
+            JoinConfig(
+                model=Article,
+                join_on=Article.card_id == Card.id,
+                join_prefix="articles_",
+                schema_to_select=ArticleSchema,
+                join_type="left",
+                relationship_type="one-to-many",
+            )
+        ],
+    )
+    validated = await _CRUD_CARD.get_multi_joined(**params)
+    trusted = await _CRUD_CARD.get_multi_joined(**params, trust_db_types=True)
+
+    assert all(isinstance(card, CardSchema) for card in trusted["data"])
+    assert all(
+        isinstance(article, ArticleSchema)
+        for card in trusted["data"]
+        for article in card.articles
+    )
+    assert [card.model_dump() for card in trusted["data"]] == [
+        card.model_dump() for card in validated["data"]
+    ]
+
+
 @pytest.mark.asyncio
 async def test_get_multi_joined_nested_data_none_dict(async_session):
     clients = [
@@ -1155,35 +1106,11 @@ async def test_get_multi_joined_nested_data_none_dict(async_session):
     async_session.add_all(tasks)
     await async_session.commit()
 
-    task_crud = FastCRUD(Task)
-
-    result = await task_crud.get_multi_joined(
+    result = await _CRUD_TASK.get_multi_joined(
         db=async_session,
         nest_joins=True,
         schema_to_select=TaskRead,
-        joins_config=[
-            JoinConfig(
-                model=Client,
-                join_on=Task.client_id == Client.id,
-                join_prefix="client",
-                schema_to_select=ClientRead,
-                join_type="left",
-            ),
-            JoinConfig(
-                model=Department,
-                join_on=Task.department_id == Department.id,
-                join_prefix="department",
-                schema_to_select=DepartmentRead,
-                join_type="left",
-            ),
-            JoinConfig(
-                model=User,
-                join_on=Task.assignee_id == User.id,
-                join_prefix="assignee",
-                schema_to_select=UserReadSub,
-                join_type="left",
-            ),
-        ],
+        joins_config=_TASK_JOINS,
     )
 
     assert result is not None, "No data returned from the database."
@@ -1,5 +1,10 @@
+import json
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastcrud import EndpointCreator, FastCRUD, crud_router
 
 
 @pytest.mark.asyncio
@@ -89,6 +94,110 @@ async def test_read_items_with_dict_filter_config(
         assert item["name"] == name
 
 
+@pytest.mark.asyncio
+async def test_read_items_streamed_above_threshold(
+    client: TestClient,
+    async_session,
+    test_model,
+    test_data,
+    create_schema,
+    update_schema,
+):
+    for data in test_data:
+        new_item = test_model(**data)
+        async_session.add(new_item)
+    await async_session.commit()
+
+    streaming_router = crud_router(
+        session=lambda: async_session,
+        model=test_model,
+        crud=FastCRUD(test_model),
+        create_schema=create_schema,
+        update_schema=update_schema,
+        path="/test_stream",
+        tags=["Test"],
+        included_methods=["read_multi"],
+        endpoint_names={"read_multi": "get_multi"},
+        stream_threshold=5,
+    )
+    client.app.include_router(streaming_router)
+
+    streamed = client.get("/test_stream/get_multi?offset=0&limit=10")
+    buffered = client.get("/test/get_multi?offset=0&limit=10")
+
+    assert streamed.status_code == 200
+    assert "content-length" not in streamed.headers
+    assert streamed.json() == buffered.json()
+    assert len(streamed.json()["data"]) == 10
+    assert streamed.json()["total_count"] == len(test_data)
+
+    small = client.get("/test_stream/get_multi?offset=0&limit=5")
+    assert "content-length" in small.headers
+    assert len(small.json()["data"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_read_items_streamed_after_session_closed(
+    async_session, test_model, test_data, create_schema, update_schema
+):
+    for data in test_data:
+        new_item = test_model(**data)
+        async_session.add(new_item)
+    await async_session.commit()
+
+    endpoint_creator = EndpointCreator(
+        session=lambda: async_session,
+        model=test_model,
+        crud=FastCRUD(test_model),
+        create_schema=create_schema,
+        update_schema=update_schema,
+        stream_threshold=1,
+    )
+    response = await endpoint_creator._stream_items(
+        async_session, offset=0, limit=10, filters={}
+    )
+    assert not async_session.in_transaction()
+    await async_session.close()
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    data = json.loads(body)
+
+    assert len(data["data"]) == 10
+    assert data["total_count"] == len(test_data)
+
+
+@pytest.mark.asyncio
+async def test_read_items_streamed_fallbacks(
+    async_session, test_model, test_data, create_schema, update_schema
+):
+    for data in test_data:
+        new_item = test_model(**data)
+        async_session.add(new_item)
+    await async_session.commit()
+
+    endpoint_creator = EndpointCreator(
+        session=lambda: async_session,
+        model=test_model,
+        crud=FastCRUD(test_model),
+        create_schema=create_schema,
+        update_schema=update_schema,
+        stream_threshold=1,
+    )
+
+    with pytest.raises(ValueError, match="Limit and offset must be non-negative."):
+        await endpoint_creator._stream_items(
+            async_session, offset=-1, limit=10, filters={}
+        )
+
+    async with AsyncSession(binds={test_model: async_session.bind}) as unbound:
+        buffered = await endpoint_creator._stream_items(
+            unbound, offset=0, limit=10, filters={}
+        )
+
+    assert len(buffered["data"]) == 10
+    assert buffered["total_count"] == len(test_data)
+
+
 @pytest.mark.asyncio
 async def test_invalid_filter_column(invalid_filtered_client):
     pass